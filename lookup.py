@@ -25,10 +25,20 @@
 #     return decorator
 """Refactoring of RioStatConverter to a class. The lookup class allows for bidirectional conversion
 (argument of 0 returns Mario; argument of "Mario" returns 0)."""
+from __future__ import annotations
 # should try to standardize the string version of these names if possible to match with dataframe(s)
 
 # DO NOT IMPORT PANDAS HERE. WILL CAUSE OBS SCRIPTS TO FAIL
-import pandas as pd
+# pandas (and numpy) are only imported inside the Series/DataFrame helpers, which can only be
+# reached once the caller has already loaded pandas themselves
+import sys
+from functools import lru_cache, singledispatch
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 CAPTAINS = [
     'Mario',
@@ -45,330 +55,552 @@ CAPTAINS = [
     'Bowser Jr'
 ]
 
+# lookup tables are read-only, the lookup indexes below are built from them once
+CHAR_NAME = MappingProxyType({
+    0: "Mario",
+    1: "Luigi",
+    2: "DK",
+    3: "Diddy",
+    4: "Peach",
+    5: "Daisy",
+    6: "Yoshi",
+    7: "Baby Mario",
+    8: "Baby Luigi",
+    9: "Bowser",
+    10: "Wario",
+    11: "Waluigi",
+    12: "Koopa(G)",
+    13: "Toad(R)",
+    14: "Boo",
+    15: "Toadette",
+    16: "Shy Guy(R)",
+    17: "Birdo",
+    18: "Monty",
+    19: "Bowser Jr",
+    20: "Paratroopa(R)",
+    21: "Pianta(B)",
+    22: "Pianta(R)",
+    23: "Pianta(Y)",
+    24: "Noki(B)",
+    25: "Noki(R)",
+    26: "Noki(G)",
+    27: "Bro(H)",
+    28: "Toadsworth",
+    29: "Toad(B)",
+    30: "Toad(Y)",
+    31: "Toad(G)",
+    32: "Toad(P)",
+    33: "Magikoopa(B)",
+    34: "Magikoopa(R)",
+    35: "Magikoopa(G)",
+    36: "Magikoopa(Y)",
+    37: "King Boo",
+    38: "Petey",
+    39: "Dixie",
+    40: "Goomba",
+    41: "Paragoomba",
+    42: "Koopa(R)",
+    43: "Paratroopa(G)",
+    44: "Shy Guy(B)",
+    45: "Shy Guy(Y)",
+    46: "Shy Guy(G)",
+    47: "Shy Guy(Bk)",
+    48: "Dry Bones(Gy)",
+    49: "Dry Bones(G)",
+    50: "Dry Bones(R)",
+    51: "Dry Bones(B)",
+    52: "Bro(F)",
+    53: "Bro(B)",
+})
+
+CHAR_NAME_NO_VARIANT = MappingProxyType({
+    0: "Mario",
+    1: "Luigi",
+    2: "DK",
+    3: "Diddy",
+    4: "Peach",
+    5: "Daisy",
+    6: "Yoshi",
+    7: "Baby Mario",
+    8: "Baby Luigi",
+    9: "Bowser",
+    10: "Wario",
+    11: "Waluigi",
+    12: "Koopa",
+    13: "Toad",
+    14: "Boo",
+    15: "Toadette",
+    16: "Shy Guy",
+    17: "Birdo",
+    18: "Monty",
+    19: "Bowser Jr",
+    20: "Paratroopa",
+    21: "Pianta",
+    22: "Pianta",
+    23: "Pianta",
+    24: "Noki",
+    25: "Noki",
+    26: "Noki",
+    27: "Bro",
+    28: "Toadsworth",
+    29: "Toad",
+    30: "Toad",
+    31: "Toad",
+    32: "Toad",
+    33: "Magikoopa",
+    34: "Magikoopa",
+    35: "Magikoopa",
+    36: "Magikoopa",
+    37: "King Boo",
+    38: "Petey",
+    39: "Dixie",
+    40: "Goomba",
+    41: "Paragoomba",
+    42: "Koopa",
+    43: "Paratroopa",
+    44: "Shy Guy",
+    45: "Shy Guy",
+    46: "Shy Guy",
+    47: "Shy Guy",
+    48: "Dry Bones",
+    49: "Dry Bones",
+    50: "Dry Bones",
+    51: "Dry Bones",
+    52: "Bro",
+    53: "Bro",
+})
+
+STADIUM = MappingProxyType({
+    0: "Mario Stadium",
+    1: "Bowser Castle",
+    2: "Wario Palace",
+    3: "Yoshi Park",
+    4: "Peach Garden",
+    5: "DK Jungle",
+    6: "Toy Field"
+})
+
+CONTACT_TYPE = MappingProxyType({
+    255: "Miss",
+    0: "Sour - Left",
+    1: "Nice - Left",
+    2: "Perfect",
+    3: "Nice - Right",
+    4: "Sour - Right"
+})
+
+HAND = MappingProxyType({
+    0: "Left",
+    1: "Right"
+})
+
+HAND_BOOL = MappingProxyType({
+    True: "Left",
+    False: "Right"
+})
+
+INPUT_DIRECTION = MappingProxyType({
+    0: "",
+    1: "Left",
+    2: "Right",
+    3: "Left+Right",
+    4: "Down",
+    5: "Left+Down",
+    6: "Right+Down",
+    7: "Left+Right+Down",
+    8: "Up",
+    9: "Left+Up",
+    10: "Right+Up",
+    11: "Left+Right+Up",
+    13: "Left+Down+Up",
+    14: "Right+Down+Up",
+    15: "Left+Right+Down+Up"
+})
+
+PITCH_TYPE = MappingProxyType({
+    0: "Curve",
+    1: "Charge",
+    2: "ChangeUp"
+})
+
+CHARGE_TYPE = MappingProxyType({
+    0: "N/A",
+    2: "Slider",
+    3: "Perfect"
+})
+
+TYPE_OF_SWING = MappingProxyType({
+    0: "None",
+    1: "Slap",
+    2: "Charge",
+    3: "Star",
+    4: "Bunt"
+})
+
+POSITION = MappingProxyType({
+    0: "P",
+    1: "C",
+    2: "1B",
+    3: "2B",
+    4: "3B",
+    5: "SS",
+    6: "LF",
+    7: "CF",
+    8: "RF",
+    255: "Inv",
+    None: "None"
+})
+
+FIELDER_ACTIONS = MappingProxyType({
+    0: "None",
+    2: "Sliding",
+    3: "Walljump",
+})
+
+FIELDER_BOBBLES = MappingProxyType({
+    0: "None",
+    1: "Slide/stun lock",
+    2: "Fumble",
+    3: "Bobble",
+    4: "Fireball",
+    16: "Garlic knockout",
+    255: "None"
+})
+
+STEAL_TYPE = MappingProxyType({
+    0: "None",
+    1: "Ready",
+    2: "Normal",
+    3: "Perfect",
+    55: "None"
+})
+
+OUT_TYPE = MappingProxyType({
+    0: "None",
+    1: "Caught",
+    2: "Force",
+    3: "Tag",
+    4: "Force Back",
+    16: "Strike-out",
+})
+
+PITCH_RESULT = MappingProxyType({
+    0: "HBP",
+    1: "BB",
+    2: "Ball",
+    3: "Strike-looking",
+    4: "Strike-swing",
+    5: "Strike-bunting",
+    6: "Contact",
+    7: "Unknown"
+})
+
+PRIMARY_CONTACT_RESULT = MappingProxyType({
+    0: "Out",
+    1: "Foul",
+    2: "Fair",
+    3: "Fielded",
+    4: "Unknown"
+})
+
+SECONDARY_CONTACT_RESULT = MappingProxyType({
+    0: "Out-caught",
+    1: "Out-force",
+    2: "Out-tag",
+    3: "foul",
+    7: "Single",
+    8: "Double",
+    9: "Triple",
+    10: "HR",
+    11: "Error - Input",
+    12: "Error - Chem",
+    13: "Bunt",
+    14: "SacFly",
+    15: "Ground ball double Play",
+    16: "Foul catch",
+})
+
+FINAL_RESULT = MappingProxyType({
+    0: "None",
+    1: "Strikeout",
+    2: "Walk (BB)",
+    3: "Walk (HBP)",
+    4: "Out",
+    5: "Caught",
+    6: "Caught line-drive",
+    7: "Single",
+    8: "Double",
+    9: "Triple",
+    10: "HR",
+    11: "Error - Input",
+    12: "Error - Chem",
+    13: "Bunt",
+    14: "SacFly",
+    15: "Ground ball double Play",
+    16: "Foul catch"
+})
+
+MANUAL_SELECT = MappingProxyType({
+    0: "No Selected Char",
+    1: "Selected Other Char",
+    2: "Selected This Char",
+    None: "None"
+})
+
+# namespace kept so tables can still be referenced as LookupDicts.CHAR_NAME etc.
 class LookupDicts():
-    CHAR_NAME = {
-        0: "Mario",
-        1: "Luigi",
-        2: "DK",
-        3: "Diddy",
-        4: "Peach",
-        5: "Daisy",
-        6: "Yoshi",
-        7: "Baby Mario",
-        8: "Baby Luigi",
-        9: "Bowser",
-        10: "Wario",
-        11: "Waluigi",
-        12: "Koopa(G)",
-        13: "Toad(R)",
-        14: "Boo",
-        15: "Toadette",
-        16: "Shy Guy(R)",
-        17: "Birdo",
-        18: "Monty",
-        19: "Bowser Jr",
-        20: "Paratroopa(R)",
-        21: "Pianta(B)",
-        22: "Pianta(R)",
-        23: "Pianta(Y)",
-        24: "Noki(B)",
-        25: "Noki(R)",
-        26: "Noki(G)",
-        27: "Bro(H)",
-        28: "Toadsworth",
-        29: "Toad(B)",
-        30: "Toad(Y)",
-        31: "Toad(G)",
-        32: "Toad(P)",
-        33: "Magikoopa(B)",
-        34: "Magikoopa(R)",
-        35: "Magikoopa(G)",
-        36: "Magikoopa(Y)",
-        37: "King Boo",
-        38: "Petey",
-        39: "Dixie",
-        40: "Goomba",
-        41: "Paragoomba",
-        42: "Koopa(R)",
-        43: "Paratroopa(G)",
-        44: "Shy Guy(B)",
-        45: "Shy Guy(Y)",
-        46: "Shy Guy(G)",
-        47: "Shy Guy(Bk)",
-        48: "Dry Bones(Gy)",
-        49: "Dry Bones(G)",
-        50: "Dry Bones(R)",
-        51: "Dry Bones(B)",
-        52: "Bro(F)",
-        53: "Bro(B)",
-    }
-
-    CHAR_NAME_NO_VARIANT = {
-        0: "Mario",
-        1: "Luigi",
-        2: "DK",
-        3: "Diddy",
-        4: "Peach",
-        5: "Daisy",
-        6: "Yoshi",
-        7: "Baby Mario",
-        8: "Baby Luigi",
-        9: "Bowser",
-        10: "Wario",
-        11: "Waluigi",
-        12: "Koopa",
-        13: "Toad",
-        14: "Boo",
-        15: "Toadette",
-        16: "Shy Guy",
-        17: "Birdo",
-        18: "Monty",
-        19: "Bowser Jr",
-        20: "Paratroopa",
-        21: "Pianta",
-        22: "Pianta",
-        23: "Pianta",
-        24: "Noki",
-        25: "Noki",
-        26: "Noki",
-        27: "Bro",
-        28: "Toadsworth",
-        29: "Toad",
-        30: "Toad",
-        31: "Toad",
-        32: "Toad",
-        33: "Magikoopa",
-        34: "Magikoopa",
-        35: "Magikoopa",
-        36: "Magikoopa",
-        37: "King Boo",
-        38: "Petey",
-        39: "Dixie",
-        40: "Goomba",
-        41: "Paragoomba",
-        42: "Koopa",
-        43: "Paratroopa",
-        44: "Shy Guy",
-        45: "Shy Guy",
-        46: "Shy Guy",
-        47: "Shy Guy",
-        48: "Dry Bones",
-        49: "Dry Bones",
-        50: "Dry Bones",
-        51: "Dry Bones",
-        52: "Bro",
-        53: "Bro",
-    }
-
-    STADIUM = {
-        0: "Mario Stadium",
-        1: "Bowser Castle",
-        2: "Wario Palace",
-        3: "Yoshi Park",
-        4: "Peach Garden",
-        5: "DK Jungle",
-        6: "Toy Field"
-    }
-
-    CONTACT_TYPE = {
-        255: "Miss",
-        0: "Sour - Left",
-        1: "Nice - Left",
-        2: "Perfect",
-        3: "Nice - Right",
-        4: "Sour - Right"
-    }
-
-    HAND = {
-        0: "Left",
-        1: "Right"
-    }
-
-    HAND_BOOL = {
-        True: "Left",
-        False: "Right"
-    }
-
-    INPUT_DIRECTION = {
-        0: "",
-        1: "Left",
-        2: "Right",
-        3: "Left+Right",
-        4: "Down",
-        5: "Left+Down",
-        6: "Right+Down",
-        7: "Left+Right+Down",
-        8: "Up",
-        9: "Left+Up",
-        10: "Right+Up",
-        11: "Left+Right+Up",
-        13: "Left+Down+Up",
-        14: "Right+Down+Up",
-        15: "Left+Right+Down+Up"
-    }
-
-    PITCH_TYPE = {
-        0: "Curve",
-        1: "Charge",
-        2: "ChangeUp"
-    }
-
-    CHARGE_TYPE = {
-        0: "N/A",
-        2: "Slider",
-        3: "Perfect"
-    }
-
-    TYPE_OF_SWING = {
-        0: "None",
-        1: "Slap",
-        2: "Charge",
-        3: "Star",
-        4: "Bunt"
-    }
-
-    POSITION = {
-        0: "P",
-        1: "C",
-        2: "1B",
-        3: "2B",
-        4: "3B",
-        5: "SS",
-        6: "LF",
-        7: "CF",
-        8: "RF",
-        255: "Inv",
-        None: "None"
-    }
-
-    FIELDER_ACTIONS = {
-        0: "None",
-        2: "Sliding",
-        3: "Walljump",
-    }
-
-    FIELDER_BOBBLES = {
-        0: "None",
-        1: "Slide/stun lock",
-        2: "Fumble",
-        3: "Bobble",
-        4: "Fireball",
-        16: "Garlic knockout",
-        255: "None"
-    }
-
-    STEAL_TYPE = {
-        0: "None",
-        1: "Ready",
-        2: "Normal",
-        3: "Perfect",
-        55: "None"
-    }
-
-    OUT_TYPE = {
-        0: "None",
-        1: "Caught",
-        2: "Force",
-        3: "Tag",
-        4: "Force Back",
-        16: "Strike-out",
-    }
-
-    PITCH_RESULT = {
-        0: "HBP",
-        1: "BB",
-        2: "Ball",
-        3: "Strike-looking",
-        4: "Strike-swing",
-        5: "Strike-bunting",
-        6: "Contact",
-        7: "Unknown"
-    }
-
-    PRIMARY_CONTACT_RESULT = {
-        0: "Out",
-        1: "Foul",
-        2: "Fair",
-        3: "Fielded",
-        4: "Unknown"
-    }
-
-    SECONDARY_CONTACT_RESULT = {
-        0: "Out-caught",
-        1: "Out-force",
-        2: "Out-tag",
-        3: "foul",
-        7: "Single",
-        8: "Double",
-        9: "Triple",
-        10: "HR",
-        11: "Error - Input",
-        12: "Error - Chem",
-        13: "Bunt",
-        14: "SacFly",
-        15: "Ground ball double Play",
-        16: "Foul catch",
-    }
-
-    FINAL_RESULT = {
-        0: "None",
-        1: "Strikeout",
-        2: "Walk (BB)",
-        3: "Walk (HBP)",
-        4: "Out",
-        5: "Caught",
-        6: "Caught line-drive",
-        7: "Single",
-        8: "Double",
-        9: "Triple",
-        10: "HR",
-        11: "Error - Input",
-        12: "Error - Chem",
-        13: "Bunt",
-        14: "SacFly",
-        15: "Ground ball double Play",
-        16: "Foul catch"
-    }
-
-    MANUAL_SELECT = {
-        0: "No Selected Char",
-        1: "Selected Other Char",
-        2: "Selected This Char",
-        None: "None"
-    }
+    CHAR_NAME = CHAR_NAME
+    CHAR_NAME_NO_VARIANT = CHAR_NAME_NO_VARIANT
+    STADIUM = STADIUM
+    CONTACT_TYPE = CONTACT_TYPE
+    HAND = HAND
+    HAND_BOOL = HAND_BOOL
+    INPUT_DIRECTION = INPUT_DIRECTION
+    PITCH_TYPE = PITCH_TYPE
+    CHARGE_TYPE = CHARGE_TYPE
+    TYPE_OF_SWING = TYPE_OF_SWING
+    POSITION = POSITION
+    FIELDER_ACTIONS = FIELDER_ACTIONS
+    FIELDER_BOBBLES = FIELDER_BOBBLES
+    STEAL_TYPE = STEAL_TYPE
+    OUT_TYPE = OUT_TYPE
+    PITCH_RESULT = PITCH_RESULT
+    PRIMARY_CONTACT_RESULT = PRIMARY_CONTACT_RESULT
+    SECONDARY_CONTACT_RESULT = SECONDARY_CONTACT_RESULT
+    FINAL_RESULT = FINAL_RESULT
+    MANUAL_SELECT = MANUAL_SELECT
 
 # todo - more complete error handling
 
+# id(dictionary) -> (dictionary, fwd_lower, rev_lower) for every dict registered in LookupDicts
+# fwd_lower maps a lowercased key to the original key, rev_lower maps a lowercased value
+# to the first key holding that value, so a lookup is two dict probes instead of a scan
+_INDEX: dict[int, tuple[dict, dict, dict]] = {}
+
+# id(dictionary) -> whether every key is a plain int (bools and None excluded), for those dicts
+# an int term can be looked up directly without going through the lowercase string index
+_IS_INT_KEYED: dict[int, bool] = {}
+
+_MISS = object()
+
+def _build_index(dictionary: dict) -> tuple[dict, dict, dict]:
+    fwd_lower = {}
+    rev_lower = {}
+    for k, v in dictionary.items():
+        fwd_lower.setdefault(str(k).lower(), k)
+        rev_lower.setdefault(str(v).lower(), k)
+    return dictionary, fwd_lower, rev_lower
+
+def _get_index(dictionary: dict) -> tuple[dict, dict, dict]:
+    # dicts outside of LookupDicts are not cached since their id may be reused
+    index = _INDEX.get(id(dictionary))
+    if index is None:
+        return _build_index(dictionary)
+    return index
+
+def _single_lookup(index: tuple[dict, dict, dict], term):
+    dictionary, fwd_lower, rev_lower = index
+    original_term = term
+    if isinstance(term, str) and term.isdigit():
+        term = int(term)
+    if isinstance(term, float) and term.is_integer():
+        term = int(term)
+
+    str_term = str(term).lower()
+
+    if str_term in fwd_lower:
+        return dictionary.get(term, f"Invalid ID or Name: {original_term}")
+    elif str_term in rev_lower:
+        return rev_lower[str_term]
+    else:
+        return f"Invalid ID or Name: {original_term}"
+
+# typed so that True, 1 and 1.0 are cached separately, they do not translate the same
+@lru_cache(maxsize=4096, typed=True)
+def _cached_single_lookup(dictionary_id: int, term):
+    return _single_lookup(_INDEX[dictionary_id], term)
+
+def _term_lookup(dictionary: dict):
+    # builds the single term lookup for a dictionary, shared by every shape of search term
+    index = _get_index(dictionary)
+    dictionary_id = id(dictionary)
+    is_int_keyed = _IS_INT_KEYED.get(dictionary_id)
+    if is_int_keyed is None:
+        is_int_keyed = all(type(k) is int for k in dictionary)
+
+    def single_lookup(term):
+        if is_int_keyed and type(term) is int:
+            value = dictionary.get(term, _MISS)
+            if value is not _MISS:
+                return value
+        if dictionary_id in _INDEX:
+            try:
+                return _cached_single_lookup(dictionary_id, term)
+            except TypeError:
+                # unhashable terms can't be cached
+                pass
+        return _single_lookup(index, term)
+
+    return single_lookup
+
+def _translate_series(series: pd.Series, dictionary: dict) -> pd.Series:
+    import numpy as np
+    import pandas as pd
+
+    is_int_keyed = _IS_INT_KEYED.get(id(dictionary))
+    if is_int_keyed is None:
+        is_int_keyed = all(type(k) is int for k in dictionary)
+
+    # ID columns are translated by the column dtype once instead of coercing every term
+    ids = series
+    if is_int_keyed and pd.api.types.is_float_dtype(ids) and ids.notna().all() and (ids % 1 == 0).all():
+        ids = ids.astype('int64')
+    if is_int_keyed and pd.api.types.is_integer_dtype(ids) and not pd.api.types.is_bool_dtype(ids) and not ids.hasnans:
+        result = ids.map(dictionary)
+        return result.where(result.notna(), 'Invalid ID or Name: ' + series.astype(str))
+
+    # translate each distinct value once and broadcast the results back over the column
+    # missing values are translated individually so None and NaN keep their own results
+    single_lookup = _term_lookup(dictionary)
+    codes, uniques = pd.factorize(series)
+    translated = np.empty(len(uniques), dtype=object)
+    translated[:] = [single_lookup(term) for term in uniques]
+    result = np.empty(len(series), dtype=object)
+    missing = codes == -1
+    result[~missing] = translated[codes[~missing]]
+    if missing.any():
+        result[missing] = [single_lookup(term) for term in series.to_numpy(dtype=object)[missing]]
+    return pd.Series(result, index=series.index, name=series.name).infer_objects()
+
+def _translate_categorical(series: pd.Series, dictionary) -> pd.Series:
+    # translates straight into a categorical, only the distinct values are ever turned into strings
+    import pandas as pd
+
+    codes, uniques = pd.factorize(series)
+    if (codes == -1).any():
+        return _translate_series(series, dictionary).astype('category')
+
+    single_lookup = _term_lookup(dictionary)
+    translated = pd.Series([single_lookup(term) for term in uniques], dtype=object).infer_objects().astype('category')
+    categorical = pd.Categorical.from_codes(translated.cat.codes.to_numpy()[codes], dtype=translated.dtype)
+    return pd.Series(categorical, index=series.index, name=series.name)
+
+# dispatches on the type of the search term, anything unregistered is looked up as a single term
+@singledispatch
+def _lookup_terms(search_term, dictionary):
+    return _term_lookup(dictionary)(search_term)
+
+@_lookup_terms.register
+def _(search_term: list, dictionary):
+    single_lookup = _term_lookup(dictionary)
+    return [single_lookup(term) for term in search_term]
+
+_pandas_registered = False
+
+def _register_pandas_terms() -> None:
+    # Series/DataFrame handlers are registered the first time pandas shows up in sys.modules
+    global _pandas_registered
+    if _pandas_registered:
+        return
+    import pandas as pd
+
+    _lookup_terms.register(pd.Series, _translate_series)
+    _lookup_terms.register(pd.DataFrame, lambda search_term, dictionary: search_term.apply(
+        lambda column: _translate_series(column, dictionary)))
+    _pandas_registered = True
+
+# id(dictionary) -> (ID -> category code array, categorical dtype) for int-keyed tables with distinct values, None otherwise
+# IDs missing from the table (e.g. the gaps before CONTACT_TYPE's 255) have code -1
+_ID_CATEGORIES: dict[int, tuple[np.ndarray, pd.CategoricalDtype] | None] = {}
+
+_MAX_GATHER_ID = 1023
+
+def _id_categories(dictionary) -> tuple[np.ndarray, pd.CategoricalDtype] | None:
+    dictionary_id = id(dictionary)
+    if dictionary_id not in _ID_CATEGORIES:
+        import numpy as np
+        import pandas as pd
+
+        keys = list(dictionary)
+        values = list(dictionary.values())
+        if any(type(k) is not int or not 0 <= k <= _MAX_GATHER_ID for k in keys) or len(set(values)) != len(values):
+            _ID_CATEGORIES[dictionary_id] = None
+        else:
+            codes_by_id = np.full(max(keys) + 1, -1, dtype=np.int64)
+            codes_by_id[keys] = np.arange(len(keys))
+            _ID_CATEGORIES[dictionary_id] = codes_by_id, pd.CategoricalDtype(values)
+    return _ID_CATEGORIES[dictionary_id]
+
+# column name -> lookup table for create_translated_columns
+_TRANSLATED_COLUMNS = {
+    'batter_char_id': CHAR_NAME,
+    'pitcher_char_id': CHAR_NAME,
+    'fielder_char_id': CHAR_NAME,
+    'batting_hand': HAND_BOOL,
+    'fielder_jump': FIELDER_ACTIONS,
+    'fielder_position': POSITION,
+    'fielding_hand': HAND_BOOL,
+    'final_result': FINAL_RESULT,
+    'manual_select_state': MANUAL_SELECT,
+    'stick_input': INPUT_DIRECTION,
+    'type_of_contact': CONTACT_TYPE,
+    'type_of_swing': TYPE_OF_SWING,
+    'stadium': STADIUM
+}
+
+def _get_character(search_term, output_format: str):
+    # Resolve both the name and ID from a single probe of the CHAR_NAME indexes
+    dictionary, fwd_lower, rev_lower = _get_index(LookupDicts.CHAR_NAME)
+    term = search_term
+    if isinstance(term, str) and term.isdigit():
+        term = int(term)
+    if isinstance(term, float) and term.is_integer():
+        term = int(term)
+
+    if type(term) is int and term in dictionary:  # input was an ID
+        character_id = term
+        character_name = dictionary[term]
+    else:
+        str_term = str(term).lower()
+        if str_term in fwd_lower:  # input was an ID
+            character_id = fwd_lower[str_term]
+            character_name = dictionary[character_id]
+        elif str_term in rev_lower:  # input was a name
+            character_id = rev_lower[str_term]
+            character_name = search_term
+        else:
+            return f"Invalid ID or Name: {search_term}"
+
+    match output_format:
+        case "name":
+            return character_name
+        case "nameNoVariant":
+            return LookupDicts.CHAR_NAME_NO_VARIANT[character_id]
+        case "ID":
+            return character_id
+        case "IDHex":
+            return hex(character_id)
+        case _:
+            raise ValueError(f"Invalid output_format '{output_format}'. Choose from: 'name', 'nameNoVariant', 'ID', 'IDHex'")
+
+# the character table never changes, so resolved (search term, output format) pairs are reused across calls
+_cached_get_character = lru_cache(maxsize=1024, typed=True)(_get_character)
+
 class Lookup:
     def __init__(self):
-        pass
+        if not _INDEX:
+            for value in vars(LookupDicts).values():
+                if isinstance(value, MappingProxyType):
+                    _INDEX[id(value)] = _build_index(value)
+                    _IS_INT_KEYED[id(value)] = all(type(k) is int for k in value)
 
     def _lookup(self, dictionary: dict, search_term):
-        def single_lookup(term):
-            original_term = term
-            if isinstance(term, str) and term.isdigit():
-                term = int(term)
-            if isinstance(term, float) and term.is_integer():
-                term = int(term)
-
-            str_term = str(term).lower()
-            adjusted_dict = {str(k).lower(): str(v).lower() for k, v in dictionary.items()}
-
-            if str_term in adjusted_dict:
-                return dictionary.get(term, f"Invalid ID or Name: {original_term}")
-            elif str_term in adjusted_dict.values():
-                return [key for key, value in dictionary.items() if value.lower() == str_term][0]
-            else:
-                return f"Invalid ID or Name: {original_term}"
-
-        if isinstance(search_term, pd.Series):
-            return search_term.apply(single_lookup)
-        elif isinstance(search_term, pd.DataFrame):
-            return search_term.applymap(single_lookup)
-        elif isinstance(search_term, list):
-            return [single_lookup(term) for term in search_term]
-        else:
-            return single_lookup(search_term)
+        if not _pandas_registered and 'pandas' in sys.modules:
+            _register_pandas_terms()
+        return _lookup_terms(search_term, dictionary)
+
+    def _translate_series(self, dictionary: dict, series: pd.Series) -> pd.Series:
+        return _translate_series(series, dictionary)
 
     def lookup(self, dictionary: dict, search_term, auto_print: bool = False):
         result = self._lookup(dictionary, search_term)
@@ -380,26 +612,28 @@ class Lookup:
         return self._lookup(dictionary, values)
 
     def create_translated_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        column_to_dict_map = {
-            'batter_char_id': LookupDicts.CHAR_NAME,
-            'pitcher_char_id': LookupDicts.CHAR_NAME,
-            'fielder_char_id': LookupDicts.CHAR_NAME,
-            'batting_hand': LookupDicts.HAND_BOOL,
-            'fielder_jump': LookupDicts.FIELDER_ACTIONS,
-            'fielder_position': LookupDicts.POSITION,
-            'fielding_hand': LookupDicts.HAND_BOOL,
-            'final_result': LookupDicts.FINAL_RESULT,
-            'manual_select_state': LookupDicts.MANUAL_SELECT,
-            'stick_input': LookupDicts.INPUT_DIRECTION,
-            'type_of_contact': LookupDicts.CONTACT_TYPE,
-            'type_of_swing': LookupDicts.TYPE_OF_SWING,
-            'stadium': LookupDicts.STADIUM
-        }
-
-        for column, dict_name in column_to_dict_map.items():
-            if column in df.columns:
-                translated_values = self.lookup(dict_name, df[column])
-                df[f'{column}_str'] = translated_values.astype('category')
+        import pandas as pd
+
+        for column, dict_name in _TRANSLATED_COLUMNS.items():
+            if column not in df.columns:
+                continue
+
+            values = df[column]
+            id_categories = _id_categories(dict_name)
+            # ID columns gather their category codes from the table's code array, anything else (unknown IDs included) is mapped
+            if id_categories is not None and values.dtype.kind in 'iu' and not values.hasnans:
+                codes_by_id, dtype = id_categories
+                ids = values.to_numpy(dtype='int64')
+                if ((ids >= 0) & (ids < len(codes_by_id))).all():
+                    codes = codes_by_id[ids]
+                    if (codes != -1).all():
+                        df[f'{column}_str'] = pd.Categorical.from_codes(codes, dtype=dtype)
+                        continue
+
+            # HAND_BOOL is keyed by True/False, so 0/1 columns need to be cast to match
+            if dict_name is HAND_BOOL and pd.api.types.is_integer_dtype(values):
+                values = values.astype(bool)
+            df[f'{column}_str'] = _translate_categorical(values, dict_name)
 
         return df
     
@@ -414,30 +648,11 @@ class Lookup:
         # Returns:
         #     Character info in the requested format.
         
-        # First, resolve to the "other side" if needed
-        # _lookup returns name if given ID, and ID if given name
-        result = self._lookup(LookupDicts.CHAR_NAME, search_term)
-
-        # Determine name and ID from the lookup result + original input
-        if isinstance(result, int):  # input was a name, result is ID
-            character_id = result
-            character_name = search_term
-        else:  # input was an ID, result is name
-            character_name = result
-            character_id = self._lookup(LookupDicts.CHAR_NAME, result)
-
-        match output_format:
-            case "name":
-                return character_name
-            case "nameNoVariant":
-                parts = character_name.split()
-                return self._lookup(LookupDicts.CHAR_NAME_NO_VARIANT, character_id)
-            case "ID":
-                return character_id
-            case "IDHex":
-                return hex(character_id)
-            case _:
-                raise ValueError(f"Invalid output_format '{output_format}'. Choose from: 'name', 'nameNoVariant', 'ID', 'IDHex'")
+        try:
+            return _cached_get_character(search_term, output_format)
+        except TypeError:
+            # unhashable terms can't be cached
+            return _get_character(search_term, output_format)
 
 # lookup_instance = Lookup()
 
@@ -2,16 +2,14 @@
 # From a directory of stat files, creates a pitch-level data set and exports to CSV.
 
 from . import stat_file_parser
-import json
 import csv
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
 
-dataRows = []
-prevEv = {}
-
-#  Helper generator to load StatObjs from a directory.
-def load_statobjs_from_directory(directory):
+def _decoded_paths(directory):
     for filename in os.listdir(directory):
         if "decoded" not in filename:
             continue
@@ -20,9 +18,47 @@ def load_statobjs_from_directory(directory):
         if not os.path.isfile(path):
             continue
 
-        with open(path, "r") as f:
-            jsonObj = json.load(f)
-            yield stat_file_parser.StatObj(jsonObj)
+        yield path
+
+def _parse_one(path):
+    with open(path, "rb") as f:
+        return stat_file_parser.StatObj.from_bytes(f.read())
+
+def load_statobjs_from_directory(directory, max_workers=1):
+    """
+    Helper generator to load StatObjs from a directory, in directory order.
+
+    By default files are parsed one at a time in this process, so only one parsed file is held in memory.
+    Pass max_workers=None (one worker per cpu) or a worker count above 1 to parse them in a process pool.
+    Paths are handed to the pool in windows of max_workers * 8 files, so at most one window of parsed
+    StatObjs is waiting on the consumer at a time.
+
+    The pool starts new Python processes, so a script using it must call this from under an
+    `if __name__ == "__main__":` guard (and call multiprocessing.freeze_support() first in a frozen/PyInstaller app),
+    otherwise spawn-based platforms (Windows, macOS) re-run the script or fail to start the workers.
+    """
+    paths = list(_decoded_paths(directory))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers == 1 or len(paths) < 2:
+        for path in paths:
+            yield _parse_one(path)
+        return
+
+    chunksize = 8
+    remaining = iter(paths)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            window = list(islice(remaining, max_workers * chunksize))
+            if not window:
+                break
+            yield from executor.map(_parse_one, window, chunksize=chunksize)
+
+# Strip variants (e.g. "Mario (Fireball)" -> "Mario")
+def strip_variant(name):
+    idx = name.find("(")
+    return name if idx == -1 else name[:idx]
 
 def pitch_rows_from_statobj(sf, include_character_attributes=False):
     """
@@ -32,37 +68,39 @@ def pitch_rows_from_statobj(sf, include_character_attributes=False):
     if include_character_attributes:
         _load_character_attributes()
 
-    prevEv = {}
+    player = sf.player
+    characterName = sf.characterName
+    battingHand = sf.battingHand
+
+    # constant for the whole game
+    gameID = sf.gameID()
+    gameMode = sf.gameMode()
+    stadium = sf.stadium()
 
     for ev in sf.events():
         if "Pitch" not in ev:
             continue
 
-        batterIndex = ev["Half Inning"]
+        halfInning = batterIndex = ev["Half Inning"]
         pitcherIndex = 1 - batterIndex
 
         eventNumber = ev["Event Num"]
 
-        pitchingPlayer = sf.player(pitcherIndex)
-        battingPlayer = sf.player(batterIndex)
+        pitchingPlayer = player(pitcherIndex)
+        battingPlayer = player(batterIndex)
 
-        pitchingCharacter = sf.characterName(
+        pitchingCharacter = characterName(
             pitcherIndex, ev["Pitcher Roster Loc"]
         )
-        battingCharacter = sf.characterName(
-            batterIndex, ev["Batter Roster Loc"]
+        battingOrder = ev["Batter Roster Loc"]
+        battingCharacter = characterName(
+            batterIndex, battingOrder
         )
 
-        # Strip variants (e.g. "Mario (Fireball)" -> "Mario")
-        def strip_variant(name):
-            idx = name.find("(")
-            return name if idx == -1 else name[:idx]
-
         pitchingCharacterNoVariant = strip_variant(pitchingCharacter)
         battingCharacterNoVariant = strip_variant(battingCharacter)
 
         inning = ev["Inning"]
-        halfInning = ev["Half Inning"]
 
         if halfInning == 0:
             pitchingScore = ev["Home Score"]
@@ -83,30 +121,23 @@ def pitch_rows_from_statobj(sf, include_character_attributes=False):
         stamina = ev["Pitcher Stamina"]
         chemistry = ev["Chemistry Links on Base"]
 
-        battingOrder = ev["Batter Roster Loc"]
-        batterHand = sf.battingHand(batterIndex, ev["Batter Roster Loc"])
+        batterHand = battingHand(batterIndex, battingOrder)
 
         # Count runners on base
-        runners = sum(
-            base in ev for base in ("Runner 1B", "Runner 2B", "Runner 3B")
-        )
-
-
-        pitchType = ev["Pitch"]["Pitch Type"]
-        pitchXPos = ev["Pitch"]["Ball Position - Strikezone"]
-        pitchInZone = ev["Pitch"]["In Strikezone"]
-        swingType = ev["Pitch"]["Type of Swing"]
-        batterPosX = ev["Pitch"]["Bat Contact Pos - X"]
-        batterPosZ = ev["Pitch"]["Bat Contact Pos - Z"]
+        runners = ("Runner 1B" in ev) + ("Runner 2B" in ev) + ("Runner 3B" in ev)
+
+        pitch = ev["Pitch"]
+        pitchType = pitch["Pitch Type"]
+        pitchXPos = pitch["Ball Position - Strikezone"]
+        pitchInZone = pitch["In Strikezone"]
+        swingType = pitch["Type of Swing"]
+        batterPosX = pitch["Bat Contact Pos - X"]
+        batterPosZ = pitch["Bat Contact Pos - Z"]
         rBIs = ev["RBI"]
         result = ev["Result of AB"]
 
-        gameID = sf.gameID()
-        gameMode = sf.gameMode()
-        stadium = sf.stadium()
-
         # Base pitch row (unchanged schema)
-        row = [
+        row = (
             eventNumber,
             pitchingPlayer,
             battingPlayer,
@@ -140,21 +171,13 @@ def pitch_rows_from_statobj(sf, include_character_attributes=False):
             gameID,
             gameMode,
             stadium
-        ]
+        )
 
         # Optional: append character attributes
         if include_character_attributes:
-            pitcher_attrs = _CHAR_ATTRS.get(pitchingCharacter)
-            batter_attrs = _CHAR_ATTRS.get(battingCharacter)
-
-            for attrs in (pitcher_attrs, batter_attrs):
-                if attrs:
-                    row.extend(attrs[col] for col in _CHAR_ATTR_COLUMNS)
-                else:
-                    row.extend([""] * len(_CHAR_ATTR_COLUMNS))
+            row += _CHAR_ATTR_TUPLE.get(pitchingCharacter, _EMPTY_ATTRS) + _CHAR_ATTR_TUPLE.get(battingCharacter, _EMPTY_ATTRS)
 
         yield row
-        prevEv = ev
 
 
 BASE_HEADER = [
@@ -196,9 +219,12 @@ BASE_HEADER = [
 # for option to load character attributes data if the user would like to append it to the pitch data rows.
 _CHAR_ATTRS = None
 _CHAR_ATTR_COLUMNS = None
+# character name -> attribute values in _CHAR_ATTR_COLUMNS order, ready to append to a row
+_CHAR_ATTR_TUPLE = None
+_EMPTY_ATTRS = None
 
 def _load_character_attributes():
-    global _CHAR_ATTRS, _CHAR_ATTR_COLUMNS
+    global _CHAR_ATTRS, _CHAR_ATTR_COLUMNS, _CHAR_ATTR_TUPLE, _EMPTY_ATTRS
 
     if _CHAR_ATTRS is not None:
         return
@@ -211,9 +237,11 @@ def _load_character_attributes():
         _CHAR_ATTR_COLUMNS = reader.fieldnames[1:]  
 
         for row in reader:
-            name = row["Character"]
+            name = sys.intern(row["Character"])
             attrs[name] = row
 
+    _CHAR_ATTR_TUPLE = {name: tuple(r[c] for c in _CHAR_ATTR_COLUMNS) for name, r in attrs.items()}
+    _EMPTY_ATTRS = ("",) * len(_CHAR_ATTR_COLUMNS)
     _CHAR_ATTRS = attrs
 
 def make_header(include_char_attrs=False):
@@ -232,11 +260,13 @@ def write_pitch_csv(statobjs, output_path, include_character_attributes=False,):
 
     header = make_header(include_character_attributes)
 
-    with open(output_path, "w", newline="") as f:
+    rows = chain.from_iterable(
+        pitch_rows_from_statobj(sf, include_character_attributes=include_character_attributes) for sf in statobjs
+    )
+
+    # large write buffer so the encoded rows are flushed to disk in big chunks
+    with open(output_path, "w", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(header)
-
-        for sf in statobjs:
-            for row in pitch_rows_from_statobj(sf, include_character_attributes=include_character_attributes):
-                writer.writerow(row)
+        writer.writerows(rows)
 
@@ -1,6 +1,12 @@
 from __future__ import annotations
 from .lookup import LookupDicts, Lookup
+import json
+from bisect import bisect_left
+from collections import namedtuple
+from collections.abc import Iterable
 from datetime import datetime
+from functools import wraps
+from operator import itemgetter
 from typing import Optional, Union
 
 '''
@@ -9,17 +15,16 @@ Intended to parse "decoded" files which would be present on a user's computer
 How to use:
 - import RioStatLib obviously
 - open a Rio stat json file
-- convert from json string to obj using json.loads(jsonStr)
-- create StatObj with your stat json obj using the following:
+- create StatObj straight from the raw file contents using the following:
+	myStats = RioStatLib.StatObj.from_bytes(data)
+- or, if you already have a json obj (e.g. from json.load), using the following:
 	myStats = RioStatLib.StatObj(jsonObj)
 - call any of the built-in methods to get some stats
 
 - ex:
 	import RioStatLib
-	import json
-	with open("path/to/RioStatFile.json", "r") as jsonStr:
-		jsonObj = json.loads(jsonStr)
-		myStats = RioStatLib.StatObj(jsonObj)
+	with open("path/to/RioStatFile.json", "rb") as f:
+		myStats = RioStatLib.StatObj.from_bytes(f.read())
 		homeTeamOPS = myStats.ops(0)
 		awayTeamSLG = myStats.slg(1)
 		booERA = myStats.era(0, 4) # Boo in this example is the 4th character on the home team
@@ -42,6 +47,10 @@ Roster args:
 
 lookup = Lookup()
 
+# every version with flipped home/away teams also uses the old "Team N Roster M" keys
+VERSIONS_HOME_AWAY_FLIPPED = frozenset(("Pre 0.1.7", "0.1.7a", "0.1.8", "0.1.9", "1.9.1"))
+VERSIONS_OLD_TEAM_STRUCTURE = VERSIONS_HOME_AWAY_FLIPPED | {"1.9.2", "1.9.3", "1.9.4"}
+
 class ErrorChecker:
     @staticmethod
     def check_team_num(teamNum: int) -> None:
@@ -68,14 +77,88 @@ class ErrorChecker:
         if (baseNum < -1 or baseNum > 3):
             raise ValueError(f'Invalid base arg {baseNum}. Function only accepts base args of -1 to 3')
 
+_MONTHS = {"Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+           "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12}
+
+def _parse_stat_date(date: str) -> datetime:
+    # stat file dates look like "Mon Jan 01 12:00:00 2024", which is split by hand since strptime is slow
+    # anything unexpected goes through strptime so malformed dates raise the same errors as before
+    try:
+        _, month, day, time, year = date.split()
+        hour, minute, second = time.split(":")
+        return datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second))
+    except (ValueError, KeyError):
+        return datetime.strptime(date, "%a %b %d %H:%M:%S %Y")
+
+# the offensive stats battingAvg, obp, slg and ops are computed from
+_BATTING_FIELDS = itemgetter("At Bats", "Hits", "Walks (4 Balls)", "Walks (Hit)", "Singles", "Doubles", "Triples", "Homeruns")
+_BattingCounts = namedtuple("_BattingCounts", ["atBats", "hits", "walks", "singles", "doubles", "triples", "homeruns"])
+
+def _memoize_stat(method):
+    # stat files don't change once loaded, so derived (ratio) stats are computed once per StatObj and team/roster
+    @wraps(method)
+    def wrapper(self, teamNum: int, rosterNum: int = -1):
+        key = (method.__name__, teamNum, rosterNum)
+        result = self._derived_stats.get(key)
+        if result is None:
+            result = self._derived_stats[key] = method(self, teamNum, rosterNum)
+        return result
+    return wrapper
+
 # create stat obj
 class StatObj:
+    # no per-instance __dict__, everything a StatObj caches is listed here
+    __slots__ = ('statJson', '_version', '_flip_teams', '_old_team_format', '_team_roster_keys', '_cgs',
+                 '_game_id', '_start_date', '_end_date', '_star_mask', '_captain_charid',
+                 '_roster_stats', '_team_totals', '_derived_stats', '_event_columns')
+
     def __init__(self, statJson: dict):
         self.statJson = statJson
 
+        # the version never changes for a given stat file, so the team numbering and roster keys are resolved once
+        self._version = statJson.get('Version', 'Pre 0.1.7')
+        # 1 if home/away are swapped for this version, XORed onto team args
+        self._flip_teams = int(self._version in VERSIONS_HOME_AWAY_FLIPPED)
+        self._old_team_format = self._version in VERSIONS_OLD_TEAM_STRUCTURE
+        if self._old_team_format:
+            self._team_roster_keys = {(t, r): f"Team {t} Roster {r}" for t in (0, 1) for r in range(-1, 9)}
+        else:
+            self._team_roster_keys = {(t, r): f"{'Away' if t == 0 else 'Home'} Roster {r}" for t in (0, 1) for r in range(-1, 9)}
+        self._cgs = statJson.get("Character Game Stats")
+        # parsed on first access, see gameID/startDate/endDate
+        self._game_id = None
+        self._start_date = None
+        self._end_date = None
+        # bit team * 9 + roster is set if that character is a superstar
+        self._star_mask = 0
+        # team -> CharID of that team's captain
+        self._captain_charid = {}
+        # both are filled in a single pass over the character entries
+        rosterBits = {key: t * 9 + r for (t, r), key in self._team_roster_keys.items() if r != -1}
+        for key, character in (self._cgs or {}).items():
+            if character["Superstar"] == 1 and key in rosterBits:
+                self._star_mask |= 1 << rosterBits[key]
+            if character["Captain"] == 1:
+                self._captain_charid[int(character["Team"])] = character["CharID"]
+        # "Offensive Stats" / "Defensive Stats" -> each team's 9 stat dicts in roster order, see _rosterStats
+        self._roster_stats = {}
+        # (kind, team) -> field totals, see _teamTotals
+        self._team_totals = {}
+        # (method name, team, roster) -> result of the @_memoize_stat methods
+        self._derived_stats = {}
+        # event field path -> that field for every event in event order, see _eventColumn
+        self._event_columns = {}
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, str]) -> StatObj:
+        # parses the raw contents of a stat file, skipping the text decoding layer of a file opened in "r" mode
+        return cls(json.loads(data))
+
     def gameID(self) -> int:
         # returns it in int form
-        return int(self.statJson["GameID"].replace(',', ''), 16)
+        if self._game_id is None:
+            self._game_id = int(self.statJson["GameID"].replace(',', ''), 16)
+        return self._game_id
     
     def gameMode(self):
         # returns the game mode that was played
@@ -83,13 +166,17 @@ class StatObj:
 
     # should look to convert to unix or some other standard date fmt
     def startDate(self) -> datetime:
-        return datetime.strptime(self.statJson["Date - Start"], "%a %b %d %H:%M:%S %Y")
+        if self._start_date is None:
+            self._start_date = _parse_stat_date(self.statJson["Date - Start"])
+        return self._start_date
 
     def endDate(self) -> datetime:
-        return datetime.strptime(self.statJson["Date - End"], "%a %b %d %H:%M:%S %Y")
+        if self._end_date is None:
+            self._end_date = _parse_stat_date(self.statJson["Date - End"])
+        return self._end_date
 
     def version(self) -> str:
-        return self.statJson.get('Version', 'Pre 0.1.7')
+        return self._version
 
     def stadium(self) -> str:
         # returns the stadium that was played on
@@ -109,15 +196,11 @@ class StatObj:
         # For Project Rio versions 1.9.2 and later
         # teamNum: 0 == away team, 1 == home team
 
-        ErrorChecker.check_team_num(teamNum)
-
-
-        VERSION_LIST_HOME_AWAY_FLIPPED = ["Pre 0.1.7", "0.1.7a", "0.1.8", "0.1.9", "1.9.1"]
+        # the checks are inlined on hot paths, ErrorChecker is only called to raise the error
+        if teamNum != 0 and teamNum != 1:
+            ErrorChecker.check_team_num(teamNum)
 
-        if self.version() in VERSION_LIST_HOME_AWAY_FLIPPED:
-            return abs(teamNum-1)
-        
-        return teamNum
+        return teamNum ^ self._flip_teams
 
 
     def player(self, teamNum: int) -> str:
@@ -159,7 +242,7 @@ class StatObj:
 
     def wasQuit(self) -> bool:
         # returns if the game was quit out early
-        return self.statJson["Quitter Team"] != ""
+        return bool(self.statJson.get("Quitter Team"))
 
     def quitter(self) -> str:
         # returns the name of the quitter if the game was quit. empty string if no quitter
@@ -179,31 +262,22 @@ class StatObj:
 
     def isSuperstarGame(self) -> bool:
         # returns if the game has any superstar characters in it
-        isStarred = False
-        charStats = self.characterGameStats()
-        for character in charStats:
-            if charStats[character]["Superstar"] == 1:
-                isStarred = True
-        return isStarred
+        return self._star_mask != 0
 
     def getTeamString(self, teamNum: int, rosterNum: int) -> str:
-        ErrorChecker.check_team_num(teamNum)
-        ErrorChecker.check_roster_num(rosterNum)
-
-        VERSION_LIST_OLD_TEAM_STRUCTURE = ["Pre 0.1.7", "0.1.7a", "0.1.8", "0.1.9", "1.9.1", "1.9.2", "1.9.3", "1.9.4"]
-        if self.version() in VERSION_LIST_OLD_TEAM_STRUCTURE:
-            return f"Team {teamNum} Roster {rosterNum}"
-
-        # Newer Version Format
-        teamStr = "Away" if teamNum == 0 else "Home"
-        return f"{teamStr} Roster {rosterNum}"
+        key = self._team_roster_keys.get((teamNum, rosterNum))
+        if key is None:
+            ErrorChecker.check_team_num(teamNum)
+            ErrorChecker.check_roster_num(rosterNum)
+            raise KeyError((teamNum, rosterNum))
+        return key
     
     def getRosterDict(self, teamNum: int) -> dict[int, str]:
         # returns a dict of rosterNum: characterName for the given team
         teamNum = self.teamNumVersionCorrection(teamNum)
         rosterDict = {}
         for x in range(0, 9):
-            rosterDict[x] = self.statJson["Character Game Stats"][self.getTeamString(teamNum, x)]["CharID"]
+            rosterDict[x] = self._cgs[self._team_roster_keys[(teamNum, x)]]["CharID"]
         return rosterDict
 
     def characterName(self, teamNum: int, rosterNum: int = -1, output_format: str = "name") -> Union[str | int, list[str] | list[int]]:
@@ -211,15 +285,16 @@ class StatObj:
         # if no roster spot is provided, returns a list of characters on a given team
         # teamNum: 0 == home team, 1 == away team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
-        ErrorChecker.check_team_num(teamNum)
-        ErrorChecker.check_roster_num(rosterNum)
+        teamNum = self.teamNumVersionCorrection(teamNum)
+        if rosterNum < -1 or rosterNum > 8:
+            ErrorChecker.check_roster_num(rosterNum)
         if rosterNum == -1:
             charList = []
             for x in range(0, 9):
-                charList.append(lookup.get_character(self.statJson["Character Game Stats"][self.getTeamString(teamNum, x)]["CharID"], output_format=output_format))
+                charList.append(lookup.get_character(self._cgs[self._team_roster_keys[(teamNum, x)]]["CharID"], output_format=output_format))
             return charList
         else:
-            return lookup.get_character(self.statJson["Character Game Stats"][self.getTeamString(teamNum, rosterNum)]["CharID"], output_format=output_format)
+            return lookup.get_character(self._cgs[self._team_roster_keys[(teamNum, rosterNum)]]["CharID"], output_format=output_format)
 
     def isStarred(self, teamNum: int, rosterNum: int = -1) -> bool:
         # returns if a character is starred
@@ -228,247 +303,224 @@ class StatObj:
         teamNum = self.teamNumVersionCorrection(teamNum)
         ErrorChecker.check_roster_num(rosterNum)
         if rosterNum == -1:
-            for x in range(0, 9):
-                if self.statJson["Character Game Stats"][self.getTeamString(teamNum, x)]["Superstar"] == 1:
-                    return True
-            return False
+            return (self._star_mask >> (teamNum * 9)) & 0x1FF != 0
         else:
-            return self.statJson["Character Game Stats"][self.getTeamString(teamNum, rosterNum)]["Superstar"] == 1
+            return (self._star_mask >> (teamNum * 9 + rosterNum)) & 1 == 1
 
     def captain(self, teamNum: int, output_format: str = "name") -> str | int:
         # returns name of character who is the captain
         teamNum = self.teamNumVersionCorrection(teamNum)
-        captain = ""
-        for character in self.characterGameStats():
-            if character["Captain"] == 1 and int(character["Team"]) == teamNum:
-                captain = lookup.get_character(character["CharID"], output_format=output_format)
-        return captain
+        captainCharID = self._captain_charid.get(teamNum)
+        if captainCharID is None:
+            return ""
+        return lookup.get_character(captainCharID, output_format=output_format)
+
+    def _rosterStats(self, kind: str, teamNum: int) -> list[dict]:
+        # the 9 "Offensive Stats" or "Defensive Stats" dicts of a (version corrected) team, resolved once per StatObj
+        statLists = self._roster_stats.get(kind)
+        if statLists is None:
+            keys = self._team_roster_keys
+            statLists = self._roster_stats[kind] = [[self._cgs[keys[(t, r)]][kind] for r in range(9)] for t in (0, 1)]
+        return statLists[teamNum]
+
+    def _teamTotals(self, kind: str, teamNum: int) -> dict[str, int]:
+        # every integer "Offensive Stats" or "Defensive Stats" field summed over a (version corrected) team
+        # built in one pass over the roster the first time any team total is asked for
+        key = (kind, teamNum)
+        totals = self._team_totals.get(key)
+        if totals is None:
+            roster = self._rosterStats(kind, teamNum)
+            # every character has the same stat fields, so one C-level itemgetter pulls them all out of each dict
+            fields = tuple(field for field, value in roster[0].items() if type(value) is int)
+            if len(fields) > 1:
+                getter = itemgetter(*fields)
+            else:
+                getter = lambda stats: tuple(stats[field] for field in fields)
+            totals = self._team_totals[key] = dict(zip(fields, map(sum, zip(*map(getter, roster)))))
+        return totals
+
+    @staticmethod
+    def bulk_aggregate(statObjs: list[StatObj]) -> list[dict[str, list[dict[str, int]]]]:
+        # team totals of every integer offensive and defensive stat for many games, each roster is walked once per game
+        # result[game]["Offensive Stats" or "Defensive Stats"][teamNum] -> {field: total}
+        kinds = ("Offensive Stats", "Defensive Stats")
+        results = []
+        for statObj in statObjs:
+            teams = (statObj.teamNumVersionCorrection(0), statObj.teamNumVersionCorrection(1))
+            results.append({kind: [dict(statObj._teamTotals(kind, t)) for t in teams] for kind in kinds})
+        return results
 
     def offensiveStats(self, teamNum: int, rosterNum: int = -1) -> Union[dict, list[dict]]:
         # grabs offensive stats of a character as seen in the stat json
         # if no roster provided, returns a list of all character's offensive stats
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        ErrorChecker.check_roster_num(rosterNum)
+        if rosterNum < -1 or rosterNum > 8:
+            ErrorChecker.check_roster_num(rosterNum)
         if rosterNum == -1:
-            oStatList = []
-            for x in range(0, 9):
-                oStatList.append(self.statJson["Character Game Stats"][self.getTeamString(teamNum, x)]["Offensive Stats"])
-            return oStatList
+            return list(self._rosterStats("Offensive Stats", teamNum))
         else:
-            return self.statJson["Character Game Stats"][self.getTeamString(teamNum, rosterNum)]["Offensive Stats"]
+            return self._rosterStats("Offensive Stats", teamNum)[rosterNum]
 
     def defensiveStats(self, teamNum: int, rosterNum: int = -1) -> Union[dict, list[dict]]:
         # grabs defensive stats of a character as seen in the stat json
         # if no roster provided, returns a list of all character's defensive stats
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        ErrorChecker.check_roster_num(rosterNum)
+        if rosterNum < -1 or rosterNum > 8:
+            ErrorChecker.check_roster_num(rosterNum)
         if rosterNum == -1:
-            dStatList = []
-            for x in range(0, 9):
-                dStatList.append(self.statJson["Character Game Stats"][self.getTeamString(teamNum, x)]["Defensive Stats"])
-            return dStatList
+            return list(self._rosterStats("Defensive Stats", teamNum))
         else:
-            return self.statJson["Character Game Stats"][self.getTeamString(teamNum, rosterNum)]["Defensive Stats"]
+            return self._rosterStats("Defensive Stats", teamNum)[rosterNum]
 
     def fieldingHand(self, teamNum: int, rosterNum: int) -> int:
         # returns fielding handedness of character
         # rosterNum: 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        ErrorChecker.check_roster_num_no_neg(rosterNum)
-        return self.statJson["Character Game Stats"][self.getTeamString(teamNum, rosterNum)]["Fielding Hand"]
+        if rosterNum < 0 or rosterNum > 8:
+            ErrorChecker.check_roster_num_no_neg(rosterNum)
+        return self._cgs[self._team_roster_keys[(teamNum, rosterNum)]]["Fielding Hand"]
 
     def battingHand(self, teamNum: int, rosterNum: int) -> int:
         # returns batting handedness of character
         # rosterNum: 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        ErrorChecker.check_roster_num_no_neg(rosterNum)
-        return self.statJson["Character Game Stats"][self.getTeamString(teamNum, rosterNum)]["Batting Hand"]
+        if rosterNum < 0 or rosterNum > 8:
+            ErrorChecker.check_roster_num_no_neg(rosterNum)
+        return self._cgs[self._team_roster_keys[(teamNum, rosterNum)]]["Batting Hand"]
+
+    def _sumDefensive(self, teamNum: int, rosterNum: int, field: str) -> int:
+        # returns a defensive stat of a character, or the team total if rosterNum == -1
+        # teamNum must already be version corrected
+        if rosterNum == -1:
+            return self._teamTotals("Defensive Stats", teamNum)[field]
+        if rosterNum < 0 or rosterNum > 8:
+            ErrorChecker.check_roster_num(rosterNum)
+        return self._rosterStats("Defensive Stats", teamNum)[rosterNum][field]
+
+    def _sumOffensive(self, teamNum: int, rosterNum: int, field: str) -> int:
+        # returns an offensive stat of a character, or the team total if rosterNum == -1
+        # teamNum must already be version corrected
+        if rosterNum == -1:
+            return self._teamTotals("Offensive Stats", teamNum)[field]
+        if rosterNum < 0 or rosterNum > 8:
+            ErrorChecker.check_roster_num(rosterNum)
+        return self._rosterStats("Offensive Stats", teamNum)[rosterNum][field]
 
     # defensive stats
+    @_memoize_stat
     def era(self, teamNum: int, rosterNum: int = -1) -> float:
         # tells the era of a character
         # if no character given, returns era of that team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        return 9 * float(self.runsAllowed(teamNum, rosterNum)) / self.inningsPitched(teamNum, rosterNum)
+        runsAllowed = self._sumDefensive(teamNum, rosterNum, "Runs Allowed")
+        inningsPitched = float(self._sumDefensive(teamNum, rosterNum, "Outs Pitched")) / 3
+        return 9 * float(runsAllowed) / inningsPitched
 
     def battersFaced(self, teamNum: int, rosterNum: int = -1) -> int:
         # tells how many batters were faced by character
         # if no character given, returns batters faced by that team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Batters Faced"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Batters Faced"]
+        return self._sumDefensive(teamNum, rosterNum, "Batters Faced")
 
     def runsAllowed(self, teamNum: int, rosterNum: int = -1) -> int:
         # tells how many runs a character allowed when pitching
         # if no character given, returns runs allowed by that team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Runs Allowed"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Runs Allowed"]
+        return self._sumDefensive(teamNum, rosterNum, "Runs Allowed")
 
     def battersWalked(self, teamNum: int, rosterNum: int = -1) -> int:
         # tells how many walks a character allowed when pitching
         # if no character given, returns walks by that team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        return self.battersWalkedBallFour(teamNum, rosterNum) + self.battersHitByPitch(teamNum, rosterNum)
+        return self._sumDefensive(teamNum, rosterNum, "Batters Walked") + self._sumDefensive(teamNum, rosterNum, "Batters Hit")
 
     def battersWalkedBallFour(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many times a character has walked a batter via 4 balls
         # if no character given, returns how many times the team walked via 4 balls
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Batters Walked"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Batters Walked"]
+        return self._sumDefensive(teamNum, rosterNum, "Batters Walked")
 
     def battersHitByPitch(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many times a character walked a batter by hitting them by a pitch
         # if no character given, returns walked via HBP for the team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Batters Hit"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Batters Hit"]
+        return self._sumDefensive(teamNum, rosterNum, "Batters Hit")
 
     def hitsAllowed(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many hits a character allowed as pitcher
         # if no character given, returns how many hits a team allowed
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Hits Allowed"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Hits Allowed"]
+        return self._sumDefensive(teamNum, rosterNum, "Hits Allowed")
 
     def homerunsAllowed(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many homeruns a character allowed as pitcher
         # if no character given, returns how many homeruns a team allowed
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["HRs Allowed"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["HRs Allowed"]
+        return self._sumDefensive(teamNum, rosterNum, "HRs Allowed")
 
     def pitchesThrown(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many pitches a character threw
         # if no character given, returns how many pitches a team threw
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Pitches Thrown"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Pitches Thrown"]
+        return self._sumDefensive(teamNum, rosterNum, "Pitches Thrown")
 
     def stamina(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns final pitching stamina of a pitcher
         # if no character given, returns total stamina of a team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Stamina"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Stamina"]
+        return self._sumDefensive(teamNum, rosterNum, "Stamina")
         
     def wasPitcher(self, teamNum: int, rosterNum: int) -> bool:
         # returns if a character was a pitcher
         # rosterNum: 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
         ErrorChecker.check_roster_num_no_neg(rosterNum)
-        return self.defensiveStats(teamNum, rosterNum)["Was Pitcher"] == 1
+        return self._rosterStats("Defensive Stats", teamNum)[rosterNum]["Was Pitcher"] == 1
 
     def strikeoutsPitched(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many strikeouts a character pitched
         # if no character given, returns how mnany strikeouts a team pitched
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Strikeouts"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Strikeouts"]
+        return self._sumDefensive(teamNum, rosterNum, "Strikeouts")
 
     def starPitchesThrown(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many star pitches a character threw
         # if no character given, returns how many star pitches a team threw
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Star Pitches Thrown"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Star Pitches Thrown"]
+        return self._sumDefensive(teamNum, rosterNum, "Star Pitches Thrown")
 
     def bigPlays(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many big plays a character had
         # if no character given, returns how many big plays a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Big Plays"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Big Plays"]
+        return self._sumDefensive(teamNum, rosterNum, "Big Plays")
 
     def outsPitched(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many outs a character was pitching for
         # if no character given, returns how many outs a team pitched for
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.defensiveStats(teamNum, x)["Outs Pitched"]
-            return total
-        else:
-            return self.defensiveStats(teamNum, rosterNum)["Outs Pitched"]
+        return self._sumDefensive(teamNum, rosterNum, "Outs Pitched")
 
     def inningsPitched(self, teamNum: int, rosterNum: int = -1) -> float:
         # returns how many innings a character was pitching for
         # if no character given, returns how many innings a team pitched for
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
-        teamNum = self.teamNumVersionCorrection(teamNum)
         return float(self.outsPitched(teamNum, rosterNum)) / 3
 
     def pitchesPerPosition(self, teamNum: int, rosterNum: int) -> dict:
@@ -476,14 +528,14 @@ class StatObj:
         # rosterNum: 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
         ErrorChecker.check_roster_num_no_neg(rosterNum)
-        return self.defensiveStats(teamNum, rosterNum)["Pitches Per Position"][0]
+        return self._rosterStats("Defensive Stats", teamNum)[rosterNum]["Pitches Per Position"][0]
 
     def outsPerPosition(self, teamNum: int, rosterNum: int) -> dict:
         # returns a dict which tracks how many outs a character was at a position for
         # rosterNum: 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
         ErrorChecker.check_roster_num_no_neg(rosterNum)
-        return self.defensiveStats(teamNum, rosterNum)["Outs Per Position"][0]
+        return self._rosterStats("Defensive Stats", teamNum)[rosterNum]["Outs Per Position"][0]
 
     # offensive stats
 
@@ -492,243 +544,234 @@ class StatObj:
         # if no character given, returns how many at bats a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["At Bats"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["At Bats"]
+        return self._sumOffensive(teamNum, rosterNum, "At Bats")
 
     def hits(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many hits a character had
         # if no character given, returns how many hits a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Hits"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Hits"]
+        return self._sumOffensive(teamNum, rosterNum, "Hits")
 
     def singles(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many singles a character had
         # if no character given, returns how many singles a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Singles"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Singles"]
+        return self._sumOffensive(teamNum, rosterNum, "Singles")
 
     def doubles(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many doubles a character had
         # if no character given, returns how many doubles a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Doubles"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Doubles"]
+        return self._sumOffensive(teamNum, rosterNum, "Doubles")
 
     def triples(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many triples a character had
         # if no character given, returns how many triples a teams had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Triples"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Triples"]
+        return self._sumOffensive(teamNum, rosterNum, "Triples")
 
     def homeruns(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many homeruns a character had
         # if no character given, returns how many homeruns a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Homeruns"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Homeruns"]
+        return self._sumOffensive(teamNum, rosterNum, "Homeruns")
 
     def buntsLanded(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many successful bunts a character had
         # if no character given, returns how many successful bunts a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Successful Bunts"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Successful Bunts"]
+        return self._sumOffensive(teamNum, rosterNum, "Successful Bunts")
 
     def sacFlys(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many sac flys a character had
         # if no character given, returns how many sac flys a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Sac Flys"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Sac Flys"]
+        return self._sumOffensive(teamNum, rosterNum, "Sac Flys")
 
     def strikeouts(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many times a character struck out when batting
         # if no character given, returns how many times a team struck out when batting
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Strikeouts"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Strikeouts"]
+        return self._sumOffensive(teamNum, rosterNum, "Strikeouts")
 
-    def walks(self, teamNum: int, rosterNum: int) -> int:
+    def walks(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many times a character was walked when batting
         # if no character given, returns how many times a team was walked when batting
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        return self.walksBallFour(teamNum, rosterNum) + self.walksHitByPitch(teamNum, rosterNum)
+        return self._sumOffensive(teamNum, rosterNum, "Walks (4 Balls)") + self._sumOffensive(teamNum, rosterNum, "Walks (Hit)")
 
     def walksBallFour(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many times a character was walked via 4 balls when batting
         # if no character given, returns how many times a team was walked via 4 balls when batting
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Walks (4 Balls)"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Walks (4 Balls)"]
+        return self._sumOffensive(teamNum, rosterNum, "Walks (4 Balls)")
 
     def walksHitByPitch(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many times a character was walked via hit by pitch when batting
         # if no character given, returns how many times a team was walked via hit by pitch when batting
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Walks (Hit)"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Walks (Hit)"]
+        return self._sumOffensive(teamNum, rosterNum, "Walks (Hit)")
 
     def rbi(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many RBI's a character had
         # if no character given, returns how many RBI's a team had
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["RBI"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["RBI"]
+        return self._sumOffensive(teamNum, rosterNum, "RBI")
 
     def basesStolen(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many times a character successfully stole a base
         # if no character given, returns how many times a team successfully stole a base
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Bases Stolen"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Bases Stolen"]
+        return self._sumOffensive(teamNum, rosterNum, "Bases Stolen")
 
     def starHitsUsed(self, teamNum: int, rosterNum: int = -1) -> int:
         # returns how many star hits a character used
         # if no character given, returns how many star hits a team used
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
         teamNum = self.teamNumVersionCorrection(teamNum)
-        if rosterNum == -1:
-            total = 0
-            for x in range(0, 9):
-                total += self.offensiveStats(teamNum, x)["Star Hits"]
-            return total
-        else:
-            return self.offensiveStats(teamNum, rosterNum)["Star Hits"]
+        return self._sumOffensive(teamNum, rosterNum, "Star Hits")
 
     # complicated stats
 
+    def _battingCounts(self, teamNum: int, rosterNum: int = -1) -> _BattingCounts:
+        # the offensive counts the rate stats are built from, read in one go from a character's stats or the team totals
+        teamNum = self.teamNumVersionCorrection(teamNum)
+        if rosterNum == -1:
+            stats = self._teamTotals("Offensive Stats", teamNum)
+        else:
+            if rosterNum < 0 or rosterNum > 8:
+                ErrorChecker.check_roster_num(rosterNum)
+            stats = self._rosterStats("Offensive Stats", teamNum)[rosterNum]
+        atBats, hits, walksBallFour, walksHit, singles, doubles, triples, homeruns = _BATTING_FIELDS(stats)
+        return _BattingCounts(atBats, hits, walksBallFour + walksHit, singles, doubles, triples, homeruns)
+
+    @_memoize_stat
     def battingAvg(self, teamNum: int, rosterNum: int = -1) -> float:
         # returns the batting average of a character
         # if no character given, returns the batting average of a team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
-        teamNum = self.teamNumVersionCorrection(teamNum)
-        nAtBats = self.atBats(teamNum, rosterNum)
-        nHits = self.hits(teamNum, rosterNum)
-        return float(nHits) / float(nAtBats)
+        # returns 0.0 for a character without an at bat
+        counts = self._battingCounts(teamNum, rosterNum)
+        if counts.atBats == 0:
+            return 0.0
+        return float(counts.hits) / float(counts.atBats)
 
+    @_memoize_stat
     def obp(self, teamNum: int, rosterNum: int = -1) -> float:
         # returns the on base percentage of a character
         # if no character given, returns the on base percentage of a team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
-        teamNum = self.teamNumVersionCorrection(teamNum)
-        nAtBats = self.atBats(teamNum, rosterNum)
-        nHits = self.hits(teamNum, rosterNum)
-        nWalks = self.walks(teamNum, rosterNum)
-        return float(nHits + nWalks) / float(nAtBats)
+        # returns 0.0 for a character without an at bat
+        counts = self._battingCounts(teamNum, rosterNum)
+        if counts.atBats == 0:
+            return 0.0
+        return float(counts.hits + counts.walks) / float(counts.atBats)
 
+    @_memoize_stat
     def slg(self, teamNum: int, rosterNum: int = -1) -> float:
         # returns the SLG of a character
         # if no character given, returns the SLG of a team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
-        teamNum = self.teamNumVersionCorrection(teamNum)
-        nAtBats = self.atBats(teamNum, rosterNum)
-        nSingles = self.singles(teamNum, rosterNum)
-        nDoubles = self.doubles(teamNum, rosterNum)
-        nTriples = self.triples(teamNum, rosterNum)
-        nHomeruns = self.homeruns(teamNum, rosterNum)
-        nWalks = self.walks(teamNum, rosterNum)
-        return float(nSingles + nDoubles * 2 + nTriples * 3 + nHomeruns * 4) / float(nAtBats - nWalks)
+        # returns 0.0 for a character without an at bat outside of walks
+        counts = self._battingCounts(teamNum, rosterNum)
+        if counts.atBats - counts.walks == 0:
+            return 0.0
+        return float(counts.singles + counts.doubles * 2 + counts.triples * 3 + counts.homeruns * 4) / float(counts.atBats - counts.walks)
 
+    @_memoize_stat
     def ops(self, teamNum: int, rosterNum: int = -1) -> float:
         # returns the OPS of a character
         # if no character given, returns the OPS of a team
         # rosterNum: optional (no arg == all characters on team), 0 -> 8 for each of the 9 roster spots
-        teamNum = self.teamNumVersionCorrection(teamNum)
-        return self.obp(teamNum, rosterNum) + self.slg(teamNum, rosterNum)
+        counts = self._battingCounts(teamNum, rosterNum)
+        obp = float(counts.hits + counts.walks) / float(counts.atBats) if counts.atBats else 0.0
+        slg = float(counts.singles + counts.doubles * 2 + counts.triples * 3 + counts.homeruns * 4) / float(counts.atBats - counts.walks) if counts.atBats - counts.walks else 0.0
+        return obp + slg
     
     def events(self) -> list[dict]:
         return self.statJson['Events']
 
     def final_event(self) -> int:
         return len(self.events())-1
-    
+
+    def _eventColumn(self, *path: str) -> tuple:
+        # one field of every event as a flat tuple, pulled out of the event dicts once per StatObj
+        # nested fields are given by their path, e.g. ('Pitch', 'Contact', 'Type of Contact'), and are None where missing
+        column = self._event_columns.get(path)
+        if column is None:
+            if len(path) == 1:
+                column = tuple(map(itemgetter(path[0]), self.events()))
+            else:
+                column = []
+                for value in self.events():
+                    for key in path:
+                        value = value.get(key)
+                        if value is None:
+                            break
+                    column.append(value)
+                column = tuple(column)
+            self._event_columns[path] = column
+        return column
+    
+
+def _index_events(column, index: dict) -> None:
+    # adds each event number to the set of the value its event has in column, skipping events without one
+    for eventNum, value in enumerate(column):
+        if value is not None:
+            index[value].add(eventNum)
+
+# actions of a character that was not in the game, see characterAtBatEvents
+_NO_CHARACTER_ACTIONS = {'AtBat': frozenset(), 'Pitching': frozenset(), 'Fielding': frozenset()}
+
+def _query_values(value):
+    # the EventSearch queries take a single value or any iterable of them (list, set, tuple, generator, ...)
+    # any scalar is wrapped, including floats and numpy integers from pandas columns
+    return (value,) if isinstance(value, (str, bytes)) or not isinstance(value, Iterable) else value
+
+def _freeze_index(index: dict) -> None:
+    # replaces every set in index, including in nested dicts, with a frozenset
+    for key, value in index.items():
+        if isinstance(value, set):
+            index[key] = frozenset(value)
+        elif isinstance(value, dict):
+            _freeze_index(value)
+
+def _abs_threshold_index(bins: dict) -> tuple[list, list[frozenset[int]]]:
+    # the distinct |key| of the bins in ascending order, and at the same position the union of
+    # every bin whose |key| is at least that, so a threshold query is one bisect
+    by_abs = {}
+    for key, events in bins.items():
+        by_abs.setdefault(abs(key), []).append(events)
+    abs_keys = sorted(by_abs)
+    cumulative = [None] * len(abs_keys)
+    running = frozenset()
+    for i in range(len(abs_keys)-1, -1, -1):
+        running = running.union(*by_abs[abs_keys[i]])
+        cumulative[i] = running
+    return abs_keys, cumulative
 
 class EventSearch():
+    # the indices are frozen once built and the getters return them as is, so the returned sets are
+    # read-only frozensets; the queries that combine several values (lists, negative thresholds) build a new set
     def __init__(self, rioStat: StatObj):
         self.debug_mode = False
 
         self.rioStat: StatObj = rioStat
+        # lowercased once for the case insensitive player queries
+        self._players_lower: tuple[str, str] = (rioStat.player(0).lower(), rioStat.player(1).lower())
 
         self._result_of_AB_dict: dict[str, set[int]] = {value: set() for value in LookupDicts.FINAL_RESULT.values()}
         self._first_fielder_position_dict: dict[str, set[int]] = {value: set() for value in LookupDicts.POSITION.values()}
@@ -740,14 +783,16 @@ class EventSearch():
 
         self._rbi_dict: dict[int, set[int]] = {i: set() for i in range(5)}
         self._inning_dict: dict[int, set[int]] = {i: set() for i in range(1, self.rioStat.inningsPlayed()+1)}
-        self._away_score_dict: dict[int, set[int]] = {i: set() for i in range(0, self.rioStat.score(0)+1)}
-        self._home_score_dict: dict[int, set[int]] = {i: set() for i in range(0, self.rioStat.score(1)+1)}
+        # sized from the scores the events actually carry, the final score can be on the other team for flipped versions
+        self._away_score_dict: dict[int, set[int]] = {i: set() for i in range(0, max(self.rioStat._eventColumn('Away Score'), default=0)+1)}
+        self._home_score_dict: dict[int, set[int]] = {i: set() for i in range(0, max(self.rioStat._eventColumn('Home Score'), default=0)+1)}
         self._balls_dict: dict[int, set[int]] = {i: set() for i in range(4)}
         self._strikes_dict: dict[int, set[int]] = {i: set() for i in range(5)}
         self._outs_in_inning_dict: dict[int, set[int]] = {i: set() for i in range(3)}
         self._half_inning_dict: dict[int, set[int]] = {i: set() for i in range(2)}
         self._chem_on_base_dict: dict[int, set[int]] = {i: set() for i in range(4)}
-        self._runners_on_base_dict: dict[int, set[int]] = {i: set() for i in range(4)}
+        # keyed by a bitmask of the occupied bases, bit 0 for 1st through bit 2 for 3rd
+        self._runners_on_base_dict: dict[int, set[int]] = {i: set() for i in range(8)}
         self._pitcher_stamina_dict: dict[int, set[int]] = {i: set() for i in range(11)}
         self._star_chance_dict: dict[int, set[int]] = {i: set() for i in range(2)}
         self._outs_during_event_dict: dict[int, set[int]] = {i: set() for i in range(4)}
@@ -755,21 +800,16 @@ class EventSearch():
         self._contact_frame_dict: dict[int, set[int]] = {i: set() for i in range(11)}
         self._ball_position_strikezone: dict[int, set[int]] = {}
         self._x_ball_contact_pos: dict[int, set[int]] = {}
+        # built on the first threshold query, see _abs_threshold_index
+        self._ball_position_strikezone_index = None
+        self._x_ball_contact_pos_index = None
 
         self._steal: set[int] = set()
         self._star_pitch: set[int] = set()
-        self._bobble: set[int] = set()
-        self._fireball_burn: set[int] = set()
         self._five_star_dinger: set[int] = set()
-        self._sliding_catch: set[int] = set()
-        self._wall_jump: set[int] = set()
         self._manual_character_selection: set[int] = set()
         self._first_pitch_of_AB: set[int] = set()
         self._last_pitch_of_AB: set[int] = set()
-        self._home_team_winning: set[int] = set()
-        self._away_team_winning: set[int] = set()
-        self._game_tied: set[int] = set()
-        self._lead_changed: set[int] = set()
 
         self.character_action_dict: dict[str, dict[str, set[int]]] = {}
         for characterDict in self.rioStat.characterGameStats().values():
@@ -779,134 +819,202 @@ class EventSearch():
                 'Fielding': set()
             }
 
-        for eventNum, event in enumerate(self.rioStat.events()):
+        # the raw event dicts are read directly (the same fields the EventObj accessors return)
+        # so no EventObj has to be built and no key is looked up more than once per event
+        characterName = self.rioStat.characterName
+        character_action_dict = self.character_action_dict
+        events = self.rioStat.events()
+
+        # fields that every event has are grouped a whole column at a time
+        for field, index in (
+            ('Away Score', self._away_score_dict),
+            ('Home Score', self._home_score_dict),
+            ('Outs', self._outs_in_inning_dict),
+            ('Chemistry Links on Base', self._chem_on_base_dict),
+            ('Strikes', self._strikes_dict),
+            ('Balls', self._balls_dict),
+            ('Inning', self._inning_dict),
+            ('RBI', self._rbi_dict),
+            ('Pitcher Stamina', self._pitcher_stamina_dict),
+            ('Star Chance', self._star_chance_dict),
+            ('Num Outs During Play', self._outs_during_event_dict),
+            ('Half Inning', self._half_inning_dict),
+            ('Result of AB', self._result_of_AB_dict),
+        ):
+            _index_events(self.rioStat._eventColumn(field), index)
+
+        # pitch and contact fields are None for events without a pitch or contact, which are left out
+        for path, index in (
+            (('Pitch', 'In Strikezone'), self._pitch_in_strikezone_dict),
+            (('Pitch', 'Type of Swing'), self._swing_type_dict),
+            (('Pitch', 'Contact', 'Type of Contact'), self._contact_type_dict),
+            (('Pitch', 'Contact', 'Input Direction - Stick'), self._input_direction_dict),
+        ):
+            _index_events(self.rioStat._eventColumn(*path), index)
+
+        # game state comparisons are made over whole score columns instead of branching inside the event loop
+        eventColumn = self.rioStat._eventColumn
+        scores = list(zip(eventColumn('Away Score'), eventColumn('Home Score'), eventColumn('Half Inning'), eventColumn('RBI')))
+        self._away_team_winning: set[int] = {eventNum for eventNum, (away, home, _, _) in enumerate(scores) if away > home}
+        self._home_team_winning: set[int] = {eventNum for eventNum, (away, home, _, _) in enumerate(scores) if away < home}
+        self._game_tied: set[int] = {eventNum for eventNum, (away, home, _, _) in enumerate(scores) if away == home}
+        # the batting team's runs on the play take it from tied or behind to ahead
+        batting_fielding_scores = [(home, away, rbi) if batting_team else (away, home, rbi) for away, home, batting_team, rbi in scores]
+        self._lead_changed: set[int] = {
+            eventNum for eventNum, (batting_score, fielding_score, rbi) in enumerate(batting_fielding_scores)
+            if fielding_score - rbi < batting_score <= fielding_score
+        }
+
+        # the per-pitch indices are bound to locals once instead of being looked up on self for every event
+        runners_on_base_dict = self._runners_on_base_dict
+        pitch_type_dict = self._pitch_type_dict
+        charge_type_dict = self._charge_type_dict
+        ball_position_strikezone = self._ball_position_strikezone
+        contact_frame_dict = self._contact_frame_dict
+        x_ball_contact_pos = self._x_ball_contact_pos
+        first_fielder_position_dict = self._first_fielder_position_dict
+        fielder_bobble_dict: dict[str, set[int]] = {}
+        fielder_action_dict: dict[str, set[int]] = {}
+
+        for eventNum, event in enumerate(events):
             # Older versions of rio overflowed past event 255, this is fixed in a later version
             # When using the search function, it is ideal for events to be singly identified.
             rioEventNum = eventNum % 256
-            currentEvent = EventObj(rioStat, eventNum)
 
-            batting_team = currentEvent.half_inning()
+            batting_team = event["Half Inning"]
             fielding_team = abs(batting_team-1)
 
-            batter = currentEvent.batter()
-            pitcher = currentEvent.pitcher()
+            batter = characterName(batting_team, event['Batter Roster Loc'])
+            pitcher = characterName(fielding_team, event['Pitcher Roster Loc'])
 
-            self.character_action_dict[batter]['AtBat'].add(eventNum)
-            self.character_action_dict[pitcher]['Pitching'].add(eventNum)
-            
-            self._away_score_dict[currentEvent.score(0)].add(eventNum)
-            self._home_score_dict[currentEvent.score(1)].add(eventNum)
+            character_action_dict[batter]['AtBat'].add(eventNum)
+            character_action_dict[pitcher]['Pitching'].add(eventNum)
 
-            if currentEvent.score(0) > currentEvent.score(1):
-                self._away_team_winning.add(eventNum)
-            elif currentEvent.score(0) < currentEvent.score(1):
-                self._home_team_winning.add(eventNum)
-            else:
-                self._game_tied.add(eventNum)
-
-            if (currentEvent.score(batting_team) + currentEvent.rbi() > currentEvent.score(fielding_team)) and (currentEvent.score(batting_team) <= currentEvent.score(fielding_team)):
-                self._lead_changed.add(eventNum)
-
-            self._outs_in_inning_dict[currentEvent.outs()].add(eventNum)
-            self._chem_on_base_dict[currentEvent.chem_links_on_base()].add(eventNum)
-            self._strikes_dict[currentEvent.strikes()].add(eventNum)
-            self._balls_dict[currentEvent.balls()].add(eventNum)
-            self._inning_dict[currentEvent.inning()].add(eventNum)
-            self._rbi_dict[currentEvent.rbi()].add(eventNum)
-            self._pitcher_stamina_dict[currentEvent.pitcher_stamina()].add(eventNum)
-            self._star_chance_dict[currentEvent.star_chance()].add(eventNum)
-            self._outs_during_event_dict[currentEvent.num_outs_during_play()].add(eventNum)
-
-            self._half_inning_dict[currentEvent.half_inning()].add(eventNum)
-            self._result_of_AB_dict[currentEvent.result_of_AB()].add(eventNum)
-            
-            if currentEvent.bool_runner_on_base(-1) == 0:
-                self._runners_on_base_dict[0].add(eventNum)
-            else:
-                for i in range(1,4):
-                    if currentEvent.bool_runner_on_base(i):
-                        self._runners_on_base_dict[i].add(eventNum)
+            runner_1B = event.get('Runner 1B')
+            runner_2B = event.get('Runner 2B')
+            runner_3B = event.get('Runner 3B')
+            runners_on_base_dict[bool(runner_1B) | bool(runner_2B) << 1 | bool(runner_3B) << 2].add(eventNum)
 
-            if currentEvent.bool_steal(-1):
+            if (runner_1B and runner_1B.get('Steal') != 'None') or (runner_2B and runner_2B.get('Steal') != 'None') \
+                    or (runner_3B and runner_3B.get('Steal') != 'None'):
                 self._steal.add(eventNum)
 
 
-            if not currentEvent.pitch_dict():
+            # the pitch, contact and first fielder dicts are fetched once each and the rest of the
+            # loop is skipped as soon as one is missing, no empty default dict is built per event
+            pitch = event.get('Pitch')
+            if not pitch:
                 continue
 
-            if currentEvent.balls() == 0 and currentEvent.strikes() == 0:
+            if event["Balls"] == 0 and event["Strikes"] == 0:
                 self._first_pitch_of_AB.add(eventNum)
 
-            if currentEvent.result_of_AB() != 'None':
+            if event['Result of AB'] != 'None':
                 self._last_pitch_of_AB.add(eventNum)
-           
-            try:
-                self._pitch_type_dict[currentEvent.pitch_type()].add(eventNum)
-            except KeyError:
-                if self.debug_mode:
-                    print(f'{self.rioStat.gameID()}, {eventNum}: Pitch Type: {currentEvent.pitch_type()}')
 
-            try:
-                self._charge_type_dict[currentEvent.charge_type()].add(eventNum)
-            except KeyError:
-                if self.debug_mode:
-                    print(f'{self.rioStat.gameID()}, {eventNum}: Charge Type: {currentEvent.charge_type()}')
+            # older versions can log types outside the lookup tables, those events are left out of the index
+            pitch_type = pitch.get('Pitch Type')
+            pitch_type_events = pitch_type_dict.get(pitch_type)
+            if pitch_type_events is not None:
+                pitch_type_events.add(eventNum)
+            elif self.debug_mode:
+                print(f'{self.rioStat.gameID()}, {eventNum}: Pitch Type: {pitch_type}')
+
+            charge_type = pitch.get('Charge Type')
+            charge_type_events = charge_type_dict.get(charge_type)
+            if charge_type_events is not None:
+                charge_type_events.add(eventNum)
+            elif self.debug_mode:
+                print(f'{self.rioStat.gameID()}, {eventNum}: Charge Type: {charge_type}')
 
-            self._pitch_in_strikezone_dict[currentEvent.in_strikezone()].add(eventNum)
-            self._swing_type_dict[currentEvent.type_of_swing()].add(eventNum)
 
-            if currentEvent.star_pitch() == 1:
+            if pitch.get('Star Pitch') == 1:
                 self._star_pitch.add(eventNum)
 
             # Banded at two decimal places
-            rounded_strikezone_x_pos = round(currentEvent.ball_position_strikezone(), 2)
-
-            if rounded_strikezone_x_pos not in self._ball_position_strikezone:
-                self._ball_position_strikezone[rounded_strikezone_x_pos] = set()
+            rounded_strikezone_x_pos = round(pitch.get('Ball Position - Strikezone'), 2)
 
-            self._ball_position_strikezone[rounded_strikezone_x_pos].add(eventNum)
+            ball_position_strikezone.setdefault(rounded_strikezone_x_pos, set()).add(eventNum)
 
-            if not currentEvent.contact_dict():
+            contact = pitch.get('Contact')
+            if not contact:
                 continue
 
-            self._contact_type_dict[currentEvent.type_of_contact()].add(eventNum)
-            self._input_direction_dict[currentEvent.stick_input_direction()].add(eventNum)
-            self._contact_frame_dict[currentEvent.contact_frame()].add(eventNum)
-    
+            contact_frame_dict[EventObj.safe_int(contact.get('Frame of Swing Upon Contact'))].add(eventNum)
+
 
-            if currentEvent.five_star_swing() == 1:
+            if contact.get('Star Swing Five-Star') == 1:
                 self._five_star_dinger.add(eventNum)
 
             # Banded at two decimal places
             
-            x_ball_contact_postion = round(currentEvent.ball_contact_position()[0], 2)
-
-            if x_ball_contact_postion not in self._x_ball_contact_pos:
-                self._x_ball_contact_pos[x_ball_contact_postion] = set()
+            x_ball_contact_postion = round(contact.get('Ball Contact Pos - X'), 2)
 
-            self._x_ball_contact_pos[x_ball_contact_postion].add(eventNum)
+            x_ball_contact_pos.setdefault(x_ball_contact_postion, set()).add(eventNum)
 
-            if not currentEvent.first_fielder_dict():
+            first_fielder = contact.get('First Fielder')
+            if not first_fielder:
                 continue
 
-            self.character_action_dict[currentEvent.first_fielder_character()]['Fielding'].add(eventNum)
+            character_action_dict[first_fielder.get('Fielder Character')]['Fielding'].add(eventNum)
 
-            if currentEvent.first_fielder_bobble() != 'None':
-                self._bobble.add(eventNum)
+            # grouped by value here, the bobble and fielder action sets are picked out after the loop
+            fielder_bobble_dict.setdefault(first_fielder.get('Fielder Bobble'), set()).add(eventNum)
+            fielder_action_dict.setdefault(first_fielder.get('Fielder Action'), set()).add(eventNum)
 
-            if currentEvent.first_fielder_bobble() == 'Fireball':
-                self._fireball_burn.add(eventNum)
+            first_fielder_position_dict[first_fielder.get('Fielder Position')].add(eventNum)
 
-            if currentEvent.first_fielder_action() == 'Sliding':
-                self._sliding_catch.add(eventNum)
-
-            if currentEvent.first_fielder_action() == 'Walljump':
-                self._wall_jump.add(eventNum)
+            if first_fielder.get('Fielder Manual Selected') != 'No Selected Char':
+                self._manual_character_selection.add(eventNum)
 
-            self._first_fielder_position_dict[currentEvent.first_fielder_position()].add(eventNum)
+        self._bobble: set[int] = set().union(*(events for bobble, events in fielder_bobble_dict.items() if bobble != 'None'))
+        self._fireball_burn: set[int] = fielder_bobble_dict.get('Fireball', set())
+        self._sliding_catch: set[int] = fielder_action_dict.get('Sliding', set())
+        self._wall_jump: set[int] = fielder_action_dict.get('Walljump', set())
+
+        # pooled results are asked for often, so they are combined once here
+        result_of_AB = self._result_of_AB_dict
+        self._all_outs: set[int] = set.union(
+            result_of_AB['Strikeout'],
+            result_of_AB['Out'],
+            result_of_AB['Caught'],
+            result_of_AB['Caught line-drive'],
+            result_of_AB['SacFly'],
+            result_of_AB['Ground ball double Play'],
+            result_of_AB['Foul catch']
+        )
+        self._all_hits: set[int] = set.union(result_of_AB['Single'], result_of_AB['Double'], result_of_AB['Triple'], result_of_AB['HR'])
+        # only the final event can be a walkoff, read straight from its dict
+        final_event = len(events) - 1
+        self._walkoff: set[int] = {final_event} if events and events[final_event]['RBI'] != 0 else set()
+        # side ('b', 'l' or 'r') -> events, see niceContactTypeEvents/sourContactTypeEvents
+        contact_type = self._contact_type_dict
+        self._nice_contact_events: dict[str, set[int]] = {
+            'b': contact_type['Nice - Left'] | contact_type['Nice - Right'],
+            'l': contact_type['Nice - Left'],
+            'r': contact_type['Nice - Right'],
+        }
+        self._sour_contact_events: dict[str, set[int]] = {
+            'b': contact_type['Sour - Left'] | contact_type['Sour - Right'],
+            'l': contact_type['Sour - Left'],
+            'r': contact_type['Sour - Right'],
+        }
 
-            if currentEvent.first_fielder_maunual_selected() != 'No Selected Char':
-                self._manual_character_selection.add(eventNum)
+        # the indices are complete, so they are frozen and the sets handed out can be shared without being changed
+        for name, value in vars(self).items():
+            if isinstance(value, set):
+                setattr(self, name, frozenset(value))
+            elif isinstance(value, dict):
+                _freeze_index(value)
+
+        # positionFieldingEvents is case insensitive, the valid positions are stored as written and lowercased
+        # so the usual spellings are found without uppercasing the argument
+        positions = LookupDicts.POSITION.values()
+        self._fielder_position_aliases: dict[str, frozenset[int]] = {}
+        for position, events in self._first_fielder_position_dict.items():
+            if position.upper() in positions:
+                self._fielder_position_aliases[position] = events
+                self._fielder_position_aliases[position.lower()] = events
     
     def __errorCheck_fielder_pos(self, fielderPos) -> None:
         # tells if fielderPos is valid
@@ -922,15 +1030,15 @@ class EventSearch():
         if halfInningNum not in [0,1]:
             raise ValueError(f'Invalid Half Inning num {halfInningNum}. Function only accepts base numbers of 0 or 1.')
 
-    def noneResultEvents(self) -> set[int]:
+    def noneResultEvents(self) -> frozenset[int]:
         # returns a set of events who's result is none
         return self._result_of_AB_dict['None']
     
-    def strikeoutResultEvents(self) -> set[int]:
+    def strikeoutResultEvents(self) -> frozenset[int]:
         # returns a set of events where the result is a strikeout
         return self._result_of_AB_dict['Strikeout']
     
-    def walkResultEvents(self, include_hbp=True, include_bb=True) -> set[int]:
+    def walkResultEvents(self, include_hbp=True, include_bb=True) -> frozenset[int]:
         # returns a set of events where the batter recorded a type of hit
         # can be used to reutrn just walks or just hbp
         # defaults to returning both
@@ -941,21 +1049,21 @@ class EventSearch():
         if include_bb:
             return self._result_of_AB_dict['Walk (BB)']
         else:
-            return set()
+            return frozenset()
         
-    def outResultEvents(self) -> set[int]:
+    def outResultEvents(self) -> frozenset[int]:
         # returns a set of events where the result is out
         return self._result_of_AB_dict['Out']
 
-    def caughtResultEvents(self) -> set[int]:
+    def caughtResultEvents(self) -> frozenset[int]:
         # returns a set of events where the result is caught
         return self._result_of_AB_dict['Caught']
     
-    def caughtLineDriveResultsEvents(self) -> set[int]:
+    def caughtLineDriveResultsEvents(self) -> frozenset[int]:
         # returns a set of events where the result is caught line drive
         return self._result_of_AB_dict['Caught line-drive']
 
-    def hitResultEvents(self, numberOfBases=0) -> set[int]:
+    def hitResultEvents(self, numberOfBases=0) -> frozenset[int]:
         # returns a set of events where the batter recorded a type of hit
         # can return singles, doubles, triples, HRs or all hits
         # returns all hits if numberOfBases is not 1-4
@@ -968,84 +1076,76 @@ class EventSearch():
         elif numberOfBases == 4:
             return self._result_of_AB_dict['HR']
         else:
-            return self._result_of_AB_dict['Single'] | self._result_of_AB_dict['Double'] | self._result_of_AB_dict['Triple'] | self._result_of_AB_dict['HR']
+            return self._all_hits
 
-    def inputErrorResultEvents(self) -> set[int]:
+    def inputErrorResultEvents(self) -> frozenset[int]:
         # returns a set of events where the result is a input error
         return self._result_of_AB_dict['Error - Input']
     
-    def chemErrorResultEvents(self) -> set[int]:
+    def chemErrorResultEvents(self) -> frozenset[int]:
         # returns a set of events where the result is a chem error
         return self._result_of_AB_dict['Error - Chem']
 
-    def buntResultEvents(self) -> set[int]:
+    def buntResultEvents(self) -> frozenset[int]:
         #returns a set of events of successful bunts
         return self._result_of_AB_dict['Bunt']
     
-    def sacFlyResultEvents(self) -> set[int]:
+    def sacFlyResultEvents(self) -> frozenset[int]:
         #returns a set of events of sac flys
         return self._result_of_AB_dict['SacFly']
     
-    def groundBallDoublePlayResultEvents(self) -> set[int]:
+    def groundBallDoublePlayResultEvents(self) -> frozenset[int]:
         # returns a set of events where the result is a ground ball double play
         return self._result_of_AB_dict['Ground ball double Play']
     
-    def foulCatchResultEvents(self) -> set[int]:
+    def foulCatchResultEvents(self) -> frozenset[int]:
         # returns a set of events where the result is a foul catch
         return self._result_of_AB_dict['Foul catch']
     
-    def allOutResultEvents(self) -> set[int]:
+    def allOutResultEvents(self) -> frozenset[int]:
         # returns a set of events where the result is any type of out
-        return set().union(
-            self.strikeoutResultEvents(),
-            self.outResultEvents(),
-            self.caughtResultEvents(),
-            self.caughtLineDriveResultsEvents(),
-            self.sacFlyResultEvents(),
-            self.groundBallDoublePlayResultEvents(),
-            self.foulCatchResultEvents()
-        )
+        return self._all_outs
 
-    def stealEvents(self) -> set[int]:
+    def stealEvents(self) -> frozenset[int]:
         # returns a set of events where an steal happened
         # types of steals: None, Ready, Normal, Perfect
         return self._steal
     
-    def starPitchEvents(self) -> set[int]:
+    def starPitchEvents(self) -> frozenset[int]:
         # returns a set of events where a star pitch is used
         return self._star_pitch
     
-    def bobbleEvents(self) -> set[int]:
+    def bobbleEvents(self) -> frozenset[int]:
         # returns a set of events where any kind of bobble occurs
         # Bobble types: "None" "Slide/stun lock" "Fumble", "Bobble", 
         # "Fireball", "Garlic knockout" "None"
         return self._bobble
     
-    def fireballBurnEvents(self) -> set[int]:
+    def fireballBurnEvents(self) -> frozenset[int]:
         # returns a set of events where a fireball burn bobble occurs
         return self._fireball_burn
     
-    def fiveStarDingerEvents(self) -> set[int]:
+    def fiveStarDingerEvents(self) -> frozenset[int]:
         # returns a set of events where a five star dinger occurs
         return self._five_star_dinger
     
-    def slidingCatchEvents(self) -> set[int]:
+    def slidingCatchEvents(self) -> frozenset[int]:
         # returns a set of events where the fielder made a sliding catch
         # not to be confused with the character ability sliding catch
         return self._sliding_catch
     
-    def wallJumpEvents(self) -> set[int]:
+    def wallJumpEvents(self) -> frozenset[int]:
         # returns a set of events where the fielder made a wall jump
         return self._wall_jump
     
-    def firstFielderPositionEvents(self, location_abbreviation) -> set[int]:
+    def firstFielderPositionEvents(self, location_abbreviation) -> frozenset[int]:
         # returns a set of events where the first fielder on the ball
         # is the one provided in the function argument
         if location_abbreviation not in self._first_fielder_position_dict:
             raise ValueError(f'Invalid roster arg {location_abbreviation}. Function only accepts location abbreviations {list(self._first_fielder_position_dict)}')
         return self._first_fielder_position_dict[location_abbreviation]
     
-    def manualCharacterSelectionEvents(self) -> set[int]:
+    def manualCharacterSelectionEvents(self) -> frozenset[int]:
         # returns a set of events where a fielder was manually selected
         return self._manual_character_selection
     
@@ -1070,357 +1170,338 @@ class EventSearch():
         if len(baseNums) > 3:
             raise ValueError('Too many baseNums provided. runnerOnBaseEvents accepts at most 3 bases')
 
-        if baseNums == [0]:
-            return self._runners_on_base_dict['None']
-
-        runner_on_base = self._runners_on_base_dict
-
-        exclude_bases = [1,2,3]
-        required_bases = []
-        optional_bases = []
+        required_mask = 0
+        optional_mask = 0
+        allow_empty_bases = False
         for i in baseNums:
-            if abs(i) in exclude_bases:
-                exclude_bases.remove(abs(i))
             if i > 0:
-                required_bases.append(i)
+                required_mask |= 1 << (i - 1)
+            elif i < 0:
+                optional_mask |= 1 << (-i - 1)
             else:
-                optional_bases.append(abs(i))
+                allow_empty_bases = True
+        exclude_mask = 0b111 & ~(required_mask | optional_mask)
 
-        if required_bases and (0 in optional_bases):
+        if required_mask and allow_empty_bases:
             raise ValueError(f'The argument 0 may only be provided alongside optional arguments or itself')
 
-        if required_bases:
-            print('required_bases')
-            result = set(range(self.eventFinal()+1))
-            for base in required_bases:
-                result.intersection_update(runner_on_base[base])
-        else:
-            result = set()
-
-        if not result:
-            for base in optional_bases:
-                result = result.union(runner_on_base[base])
-
-        if exclude_bases:
-            for base in exclude_bases:
-                result.difference_update(runner_on_base[base])
-
-        return result
+        # each base layout is matched once against the masks, events without runners only count when 0 is provided
+        return set().union(*(
+            events for mask, events in self._runners_on_base_dict.items()
+            if mask & required_mask == required_mask and not mask & exclude_mask and (mask or allow_empty_bases)
+        ))
 
     def listInputHandling(self, inputList, class_variable, to_zero=False) -> set[int]:
         # Used with class variables that have integer keys
-        result = set()
+        # the matching sets are collected first and merged in a single union at the end
+        parts = []
         for i in inputList:
             if abs(i) not in class_variable:
                 continue
             if i >= 0:
-                result = result.union(class_variable[i])
+                parts.append(class_variable[i])
             else:
-                if to_zero:
-                    for j in range(0, abs(i)):
-                        result = result.union(class_variable[j])
-                else:
-                    for j in range(abs(i), max(class_variable)+1):
-                        result = result.union(class_variable[j])
+                keys = range(0, abs(i)) if to_zero else range(abs(i), max(class_variable)+1)
+                parts.extend(map(class_variable.__getitem__, keys))
                      
-        return result
+        return set().union(*parts)
 
     def inningEvents(self, inningNum) -> set[int]:
-        inningNumList = inningNum if isinstance(inningNum, (list, set)) else [inningNum]
+        inningNumList = _query_values(inningNum)
         # returns a set of events that occurered in the inning input
         # negative inputs return all events after the specified inning
         return self.listInputHandling(inningNumList, self._inning_dict)
     
-    def awayTeamWinningEvents(self) -> set[int]:
+    def awayTeamWinningEvents(self) -> frozenset[int]:
         return self._away_team_winning
     
-    def homeTeamWinningEvents(self) -> set[int]:
+    def homeTeamWinningEvents(self) -> frozenset[int]:
         return self._home_team_winning
     
-    def gameTiedEvents(self) -> set[int]:
+    def gameTiedEvents(self) -> frozenset[int]:
         return self._game_tied
     
     def awayScoreEvents(self, awayScore) -> set[int]:
         # returns a set of events that occurered with the away score
         # negative inputs return all events with an away score greater than or equal to the input
         # inputting a list or set will return the all events that match the numbers in the list
-        awayScoreList = awayScore if isinstance(awayScore, (list, set)) else [awayScore]
-        return self.listInputHandling(awayScoreList, self._home_score_dict)
+        awayScoreList = _query_values(awayScore)
+        return self.listInputHandling(awayScoreList, self._away_score_dict)
     
     def homeScoreEvents(self, homeScore) -> set[int]:
         # returns a set of events that occurered with the home score
         # negative inputs return all events with a home score greater than or equal to the input
         # inputting a list or set will return the all events that match the numbers in the list
-        homeScoreList = homeScore if isinstance(homeScore, (list, set)) else [homeScore]
+        homeScoreList = _query_values(homeScore)
         return self.listInputHandling(homeScoreList, self._home_score_dict)
     
     def ballEvents(self, ballNum) -> set[int]:
         # returns a set of events that occurered with the number of balls in the count
         # negative inputs return all events with a ball count greater than or equal to the input
         # inputting a list or set will return the all events that match the numbers in the list
-        ballNumList = ballNum if isinstance(ballNum, (list, set)) else [ballNum]
+        ballNumList = _query_values(ballNum)
         return self.listInputHandling(ballNumList, self._balls_dict)
     
     def strikeEvents(self, strikeNum) -> set[int]:
         # returns a set of events that occurered with the number of strikes in the count
         # negative inputs return all events with a strike count greater than or equal to the input
         # inputting a list or set will return the all events that match the numbers in the list
-        strikeNumList = strikeNum if isinstance(strikeNum, (list, set)) else [strikeNum]
+        strikeNumList = _query_values(strikeNum)
         return self.listInputHandling(strikeNumList, self._strikes_dict)
 
     def chemOnBaseEvents(self, chemNum) -> set[int]:
         # returns a set of events that occurered with the number of chem on base
         # negative inputs return all events with a chem count greater than or equal to the input
         # inputting a list or set will return the all events that match the numbers in the list
-        chemNumList = chemNum if isinstance(chemNum, (list, set)) else [chemNum]
+        chemNumList = _query_values(chemNum)
         return self.listInputHandling(chemNumList, self._chem_on_base_dict)
         
     def rbiEvents(self, rbiNum) -> set[int]:
         # returns a set of events that occurered with the number of chem on base
         # negative inputs return all events with a chem count greater than or equal to the input
         # inputting a list or set will return the all events that match the numbers in the list
-        rbiNumList = rbiNum if isinstance(rbiNum, (list, set)) else [rbiNum]
+        rbiNumList = _query_values(rbiNum)
         return self.listInputHandling(rbiNumList, self._rbi_dict)
         
 
-    def halfInningEvents(self, halfInningNum: int) -> set[int]:
+    def halfInningEvents(self, halfInningNum: int) -> frozenset[int]:
           self.__errorCheck_halfInningNum(halfInningNum)
           return self._half_inning_dict[halfInningNum]
     
-    def outsInInningEvents(self, outsNum: int) -> set[int]:
+    def outsInInningEvents(self, outsNum: int) -> frozenset[int]:
         self.__errorCheck_halfInningNum(outsNum)
         if outsNum >= 0:
             return self._outs_in_inning_dict[outsNum]
         else:
-            result = set()
-            for i in range(abs(outsNum), 3):
-                result = result.union(self._outs_in_inning_dict[i])
-            return result
+            return frozenset().union(*map(self._outs_in_inning_dict.__getitem__, range(abs(outsNum), 3)))
         
     def pitcherStaminaEvents(self, stamina) -> set[int]:
         # returns a set of events that occurered with the number of pitcher stamina
         # negative inputs return all events with a stamina LESS THAN or equal to the input
         # inputting a list or set will return the all events that match the numbers in the list
-        staminaList = stamina if isinstance(stamina, (list, set)) else [stamina]
-        return self.listInputHandling(staminaList, 'Pitcher Stamina', to_zero=True)
+        staminaList = _query_values(stamina)
+        return self.listInputHandling(staminaList, self._pitcher_stamina_dict, to_zero=True)
 
-    def starChanceEvents(self, isStarChance=True) -> set[int]:
+    def starChanceEvents(self, isStarChance=True) -> frozenset[int]:
         if isStarChance:
             return self._star_chance_dict[1]
         return self._star_chance_dict[0]
 
     def numOutsDuringPlayEvents(self, numOuts) -> set[int]:
-         numOutsList = numOuts if isinstance(numOuts, (list, set)) else [numOuts]
+         numOutsList = _query_values(numOuts)
          return self.listInputHandling(numOutsList, self._outs_during_event_dict)
 
-    def curvePitchTypeEvents(self) -> set[int]:
+    def curvePitchTypeEvents(self) -> frozenset[int]:
         return self._pitch_type_dict['Curve']
     
-    def chargePitchTypeEvents(self) -> set[int]:
+    def chargePitchTypeEvents(self) -> frozenset[int]:
         return self._pitch_type_dict['Charge']
 
-    def sliderPitchTypeEvents(self) -> set[int]:
+    def sliderPitchTypeEvents(self) -> frozenset[int]:
         return self._charge_type_dict['Slider']
 
-    def perfectChargePitchTypeEvents(self) -> set[int]:
+    def perfectChargePitchTypeEvents(self) -> frozenset[int]:
         return self._charge_type_dict['Perfect']
 
-    def changeUpPitchTypeEvents(self) -> set[int]:
+    def changeUpPitchTypeEvents(self) -> frozenset[int]:
         return self._pitch_type_dict['ChangeUp']
     
+    # lowercased query name -> the method returning its events, so each name is resolved with one lookup
+    _PITCH_TYPE_EVENTS = {
+        'curve': curvePitchTypeEvents,
+        'charge': chargePitchTypeEvents,
+        'slider': sliderPitchTypeEvents,
+        'perfect': perfectChargePitchTypeEvents,
+        'changeup': changeUpPitchTypeEvents,
+    }
+    
     def pitchTypeEvents(self, pitchType) -> set[int]:
-        pitchTypeList = pitchType if isinstance(pitchType, (list, set)) else [pitchType]
+        pitchTypeList = _query_values(pitchType)
         
         result = set()
         for pitch in pitchTypeList:
-            if pitch.lower() == 'curve':
-                result = result.union(self.curvePitchTypeEvents())
-            elif pitch.lower() == 'charge':
-                result = result.union(self.chargePitchTypeEvents())
-            elif pitch.lower() == 'slider':
-                result = result.union(self.sliderPitchTypeEvents())
-            elif pitch.lower() == 'perfect':
-                result = result.union(self.perfectChargePitchTypeEvents())
-            elif pitch.lower() == 'changeup':
-                result = result.union(self.changeUpPitchTypeEvents())
-            else:
+            pitchTypeEvents = self._PITCH_TYPE_EVENTS.get(pitch.lower())
+            if pitchTypeEvents is None:
                 raise ValueError(f'{pitch} is not a valid pitch type. Curve, Charge, Slider, Perfect, and ChangeUp are accepted.')
+            result |= pitchTypeEvents(self)
         
         return result
 
-    def inStrikezoneEvents(self) -> set[int]:
+    def inStrikezoneEvents(self) -> frozenset[int]:
         return self._pitch_in_strikezone_dict[1]
 
-    def noneSwingTypeEvents(self) -> set[int]:
+    def noneSwingTypeEvents(self) -> frozenset[int]:
         return self._swing_type_dict['None']
 
-    def slapSwingTypeEvents(self) -> set[int]:
+    def slapSwingTypeEvents(self) -> frozenset[int]:
         return self._swing_type_dict['Slap']
 
-    def chargeSwingTypeEvents(self) -> set[int]:
+    def chargeSwingTypeEvents(self) -> frozenset[int]:
         return self._swing_type_dict['Charge']
 
-    def starSwingTypeEvents(self) -> set[int]:
+    def starSwingTypeEvents(self) -> frozenset[int]:
         return self._swing_type_dict['Star']
 
-    def buntSwingTypeEvents(self) -> set[int]:
+    def buntSwingTypeEvents(self) -> frozenset[int]:
         return self._swing_type_dict['Bunt']
     
+    _SWING_TYPE_EVENTS = {
+        'none': noneSwingTypeEvents,
+        'slap': slapSwingTypeEvents,
+        'charge': chargeSwingTypeEvents,
+        'star': starSwingTypeEvents,
+        'bunt': buntSwingTypeEvents,
+    }
+    
     def swingTypeEvents(self, swingType) -> set[int]:
-        swingTypeList = swingType if isinstance(swingType, (list, set)) else [swingType]
+        swingTypeList = _query_values(swingType)
         
         result = set()
         for swing in swingTypeList:
-            if swing.lower() == 'none':
-                result = result.union(self.noneSwingTypeEvents())
-            elif swing.lower() == 'slap':
-                result = result.union(self.slapSwingTypeEvents())
-            elif swing.lower() == 'charge':
-                result = result.union(self.chargeSwingTypeEvents())
-            elif swing.lower() == 'star':
-                result = result.union(self.starSwingTypeEvents())
-            elif swing.lower() == 'bunt':
-                result = result.union(self.buntSwingTypeEvents())
-            else:
+            swingTypeEvents = self._SWING_TYPE_EVENTS.get(swing.lower())
+            if swingTypeEvents is None:
                 raise ValueError(f'{swing} is not a valid swing type. None, Slap, Charge, Star, and Bunt are accepted.')
+            result |= swingTypeEvents(self)
         
         return result
     
-    def niceContactTypeEvents(self, side='b') -> set[int]:
-        if side == 'b':
-            return self._contact_type_dict['Nice - Left'] | self._contact_type_dict['Nice - Right']
-        if side == 'l':
-            return self._contact_type_dict['Nice - Left']
-        if side == 'r':
-            return self._contact_type_dict['Nice - Right']
+    def niceContactTypeEvents(self, side='b') -> frozenset[int]:
+        events = self._nice_contact_events.get(side)
+        if events is not None:
+            return events
         raise ValueError(f"Invalid side '{side}'. Must be 'b', 'l', or 'r'.")
         
-    def perfectContactTypeEvents(self) -> set[int]:
+    def perfectContactTypeEvents(self) -> frozenset[int]:
          return self._contact_type_dict['Perfect']
 
-    def sourContactTypeEvents(self, side='b') -> set[int]:
-        if side == 'b':
-            return self._contact_type_dict['Sour - Left'] | self._contact_type_dict['Sour - Right']
-        if side == 'l':
-            return self._contact_type_dict['Sour - Left']
-        if side == 'r':
-            return self._contact_type_dict['Sour - Right']
+    def sourContactTypeEvents(self, side='b') -> frozenset[int]:
+        events = self._sour_contact_events.get(side)
+        if events is not None:
+            return events
         raise ValueError(f"Invalid side '{side}'. Must be 'b', 'l', or 'r'.")
 
+    _CONTACT_TYPE_EVENTS = {
+        'sour': sourContactTypeEvents,
+        'nice': niceContactTypeEvents,
+        'perfect': perfectContactTypeEvents,
+    }
+
     def contactTypeEvents(self, contactType) -> set[int]:
-        contactTypeList = contactType if isinstance(contactType, (list, set)) else [contactType]
+        contactTypeList = _query_values(contactType)
         
         result = set()
         for contact in contactTypeList:
-            if contact.lower() == 'sour':
-                result = result.union(self.sourContactTypeEvents())
-            elif contact.lower() == 'nice':
-                result = result.union(self.niceContactTypeEvents())
-            elif contact.lower() == 'perfect':
-                result = result.union(self.perfectContactTypeEvents())
-            else:
+            contactTypeEvents = self._CONTACT_TYPE_EVENTS.get(contact.lower())
+            if contactTypeEvents is None:
                 raise ValueError(f'{contact} is not a valid contact type. Sour, Nice, and Perfect are accepted.')
+            result |= contactTypeEvents(self)
         
         return result
 
-    def inputDirectionEvents(self, input_directions) -> set[int]:
+    def inputDirectionEvents(self, input_directions) -> frozenset[int]:
         return self._input_direction_dict[input_directions]
 
     def contactFrameEvents(self, contactFrame) -> set[int]:
         # returns a set of contacts that occurered on the specified frame
         # negative inputs return all events with a strike count greater than or equal to the input
         # inputting a list or set will return the all events that match the numbers in the list
-        contactFrameList = contactFrame if isinstance(contactFrame, (list, set)) else [contactFrame]
+        contactFrameList = _query_values(contactFrame)
         return self.listInputHandling(contactFrameList, self._contact_frame_dict)
 
-    def characterAtBatEvents(self, char_id) -> set[int]:
+    def characterAtBatEvents(self, char_id) -> frozenset[int]:
         # returns a set of events where the input character was at bat
         # returns an empty set if the character was not in the game
         # rather than raising an error
-        if char_id not in self.character_action_dict:
-            return set()
-        return self.character_action_dict[char_id]['AtBat']
+        return self.character_action_dict.get(char_id, _NO_CHARACTER_ACTIONS)['AtBat']
 
-    def characterPitchingEvents(self, char_id) -> set[int]:
+    def characterPitchingEvents(self, char_id) -> frozenset[int]:
         # returns a set of events where the input character was pitching
         # returns an empty set if the character was not in the game
         # rather than raising an error
-        if char_id not in self.character_action_dict:
-            return set()
-        return self.character_action_dict[char_id]['Pitching']
+        return self.character_action_dict.get(char_id, _NO_CHARACTER_ACTIONS)['Pitching']
 
-    def characterFieldingEvents(self, char_id) -> set[int]:
+    def characterFieldingEvents(self, char_id) -> frozenset[int]:
         # returns a set of events where the input character is the first fielder
         # returns an empty set if the character was not in the game
         # rather than raising an error
-        if char_id not in self.character_action_dict:
-            return set()
-        return self.character_action_dict[char_id]['Fielding']
+        return self.character_action_dict.get(char_id, _NO_CHARACTER_ACTIONS)['Fielding']
     
-    def positionFieldingEvents(self, fielderPos) -> set[int]:
+    def positionFieldingEvents(self, fielderPos) -> frozenset[int]:
         # returns a set of events where the input fielding pos is the first fielder
         # raises an error when the imput fielding pos is not valid
-        self.__errorCheck_fielder_pos(fielderPos)
-        return self._first_fielder_position_dict[fielderPos.upper()]
-    
-    def walkoffEvents(self) -> set[int]:
-        final_event = EventObj(self.rioStat, self.rioStat.final_event())
+        events = self._fielder_position_aliases.get(fielderPos)
+        if events is None:
+            # mixed case or invalid
+            self.__errorCheck_fielder_pos(fielderPos)
+            events = self._first_fielder_position_dict[fielderPos.upper()]
+        return events
+    
+    def walkoffEvents(self) -> frozenset[int]:
         # returns a set of events of game walkoffs
-        if final_event.rbi() != 0:
-            return set([self.rioStat.final_event()])
-        return set()
-    
-    def playerBattingEvents(self, playerBatting) -> set[int]:
-        if playerBatting.lower() == self.rioStat.player(0).lower():
-            return self.halfInningEvents(0)
-        elif playerBatting.lower() == self.rioStat.player(1).lower():
-            return self.halfInningEvents(1)
+        return self._walkoff
+    
+    def playerBattingEvents(self, playerBatting) -> frozenset[int]:
+        playerBatting = playerBatting.lower()
+        if playerBatting == self._players_lower[0]:
+            return self._half_inning_dict[0]
+        elif playerBatting == self._players_lower[1]:
+            return self._half_inning_dict[1]
         else:
-            return set()
+            return frozenset()
         
-    def playerPitchingEvents(self, playerPitching) -> set[int]:
-        if playerPitching.lower() == self.rioStat.player(0).lower():
-            return self.halfInningEvents(1)
-        elif playerPitching.lower() == self.rioStat.player(1).lower():
-            return self.halfInningEvents(0)
+    def playerPitchingEvents(self, playerPitching) -> frozenset[int]:
+        playerPitching = playerPitching.lower()
+        if playerPitching == self._players_lower[0]:
+            return self._half_inning_dict[1]
+        elif playerPitching == self._players_lower[1]:
+            return self._half_inning_dict[0]
         else:
-            return set()
+            return frozenset()
         
-    def ballPositionStrikezoneEvents(self, minimimum_ball_pos) -> set[int]:
-        result = set()
-        for key in self._ball_position_strikezone:
-            if abs(key) >= abs(minimimum_ball_pos):
-                result = result.union(set(self._ball_position_strikezone[key]))
-        return result
-    
-    def ballContactPositionEvents(self, minimimum_ball_pos) -> set[int]:
-        result = set()
-        for key in self._x_ball_contact_pos:
-            if abs(key) >= abs(minimimum_ball_pos):
-                result = result.union(set(self._x_ball_contact_pos[key]))
-        return result
-    
-    def firstPitchOfABEvents(self) -> set[int]:
+    def ballPositionStrikezoneEvents(self, minimimum_ball_pos) -> frozenset[int]:
+        if self._ball_position_strikezone_index is None:
+            self._ball_position_strikezone_index = _abs_threshold_index(self._ball_position_strikezone)
+        abs_keys, cumulative = self._ball_position_strikezone_index
+        i = bisect_left(abs_keys, abs(minimimum_ball_pos))
+        return cumulative[i] if i < len(cumulative) else frozenset()
+    
+    def ballContactPositionEvents(self, minimimum_ball_pos) -> frozenset[int]:
+        if self._x_ball_contact_pos_index is None:
+            self._x_ball_contact_pos_index = _abs_threshold_index(self._x_ball_contact_pos)
+        abs_keys, cumulative = self._x_ball_contact_pos_index
+        i = bisect_left(abs_keys, abs(minimimum_ball_pos))
+        return cumulative[i] if i < len(cumulative) else frozenset()
+    
+    def firstPitchOfABEvents(self) -> frozenset[int]:
         return self._first_pitch_of_AB
     
-    def lastPitchOfABEvents(self) -> set[int]:
+    def lastPitchOfABEvents(self) -> frozenset[int]:
         return self._last_pitch_of_AB
     
-    def leadChangedEvents(self) -> set[int]:
+    def leadChangedEvents(self) -> frozenset[int]:
         return self._lead_changed
     
 
         
 
 class EventObj():
+    # no per-instance __dict__, one of these can be made for every event in a game
+    __slots__ = ('rioStat', 'all_events', 'eventDict', '_pitch', '_contact', '_first_fielder')
+
     def __init__(self, rioStat: StatObj, eventNum: int):
         self.rioStat = rioStat
         self.all_events = rioStat.events()
         if abs(eventNum) > len(self.all_events):
             raise IndexError(f'Invalid event num: Event {eventNum} does not exist in game')
         self.eventDict = self.all_events[eventNum]
+        # resolved once here, every pitch, contact and fielder accessor reads from these
+        # each is an empty dict if the event has no pitch, contact or first fielder
+        self._pitch = self.eventDict.get('Pitch', {})
+        self._contact = self._pitch.get('Contact', {})
+        self._first_fielder = self._contact.get('First Fielder', {})
 
-    def safe_int(self, value) -> Optional[int]:
+    @staticmethod
+    def safe_int(value) -> Optional[int]:
         """
         Tries to safely convert a str to an integer.
         
@@ -1437,7 +1518,8 @@ class EventObj():
             return value  # Return if it's already an integer
         elif isinstance(value, str):
             try:
-                return int(value)  # Try converting a string to an integer
+                # stat files write some values with thousands separators, e.g. "1,722"
+                return int(value.replace(',', ''))
             except ValueError:
                 raise ValueError(f"Value '{value}' is not a valid integer.")
         
@@ -1456,7 +1538,8 @@ class EventObj():
         return self.eventDict["Half Inning"]
     
     def score(self, teamNum: int) -> int:
-        ErrorChecker.check_team_num(teamNum)
+        if teamNum != 0 and teamNum != 1:
+            ErrorChecker.check_team_num(teamNum)
         if teamNum == 0:
             return self.eventDict['Away Score']
         else:
@@ -1478,7 +1561,8 @@ class EventObj():
         return self.eventDict['Star Chance']
     
     def team_stars(self, teamNum: int) -> int:
-        ErrorChecker.check_team_num(teamNum)
+        if teamNum != 0 and teamNum != 1:
+            ErrorChecker.check_team_num(teamNum)
         if teamNum == 0:
             return self.eventDict['Away Stars']
         else:
@@ -1525,25 +1609,27 @@ class EventObj():
         return self.eventDict['Result of AB']
     
     def runners(self) -> set[str]:
-        return set(self.eventDict).intersection(['Runner 1B', 'Runner 2B', 'Runner 3B'])
+        # only the three runner keys are checked, not every key of the event
+        eventDict = self.eventDict
+        return {runner_str for runner_str in ('Runner 1B', 'Runner 2B', 'Runner 3B') if runner_str in eventDict}
     
     def bool_runner_on_base(self, baseNum: int) -> int:
         """
         checks if a runner is on the supplied base number
         if -1 is provided, then all bases will be checked
         """
-        ErrorChecker.check_base_num(baseNum)
+        if baseNum < -1 or baseNum > 3:
+            ErrorChecker.check_base_num(baseNum)
         if baseNum == -1:
-            for i in range(1,4):
-                if self.bool_runner_on_base(i) == 1:
-                    return 1
-            return 0
+            eventDict = self.eventDict
+            return 1 if (eventDict.get('Runner 1B') or eventDict.get('Runner 2B') or eventDict.get('Runner 3B')) else 0
 
         runner_str = f'Runner {baseNum}B'
         return 1 if self.eventDict.get(runner_str) else 0
     
     def runner_dict(self, baseNum: int) -> dict:
-        ErrorChecker.check_base_num(baseNum)
+        if baseNum < -1 or baseNum > 3:
+            ErrorChecker.check_base_num(baseNum)
         if baseNum == 0:
             runner_str = 'Runner Batter'
         else:
@@ -1555,11 +1641,14 @@ class EventObj():
         Checks if a runner is stealing from the supplied base number.
         If -1 is provided, then all bases will be checked.
         """
-        ErrorChecker.check_base_num(base_num)
+        if base_num < -1 or base_num > 3:
+            ErrorChecker.check_base_num(base_num)
         
         if base_num == -1:  # Check all bases for a steal
-            for i in range(1, 4):
-                if self.bool_steal(i) == 1:
+            eventDict = self.eventDict
+            for runner_str in ('Runner 1B', 'Runner 2B', 'Runner 3B'):
+                runner_data = eventDict.get(runner_str)
+                if runner_data and runner_data.get('Steal') != 'None':
                     return 1
             return 0
         
@@ -1570,154 +1659,154 @@ class EventObj():
         """
         Returns an empty dict if no pitch in event
         """
-        return self.eventDict.get('Pitch', {})
+        return self._pitch
     
     def pitch_type(self) -> Optional[str]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('Pitch Type')
+        return self._pitch.get('Pitch Type')
     
     def charge_type(self) -> Optional[str]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('Charge Type')
+        return self._pitch.get('Charge Type')
     
     def star_pitch(self) -> Optional[int]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('Star Pitch')
+        return self._pitch.get('Star Pitch')
     
     def pitch_speed(self) -> Optional[int]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('Pitch Speed')
+        return self._pitch.get('Pitch Speed')
     
     def ball_position_strikezone(self) -> Optional[float]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('Ball Position - Strikezone')
+        return self._pitch.get('Ball Position - Strikezone')
     
     def in_strikezone(self) -> Optional[int]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('In Strikezone')
+        return self._pitch.get('In Strikezone')
     
     def bat_contact_position_x(self) -> Optional[float]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('Bat Contact Pos - X')
+        return self._pitch.get('Bat Contact Pos - X')
     
     def bat_contact_position_z(self) -> Optional[float]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('Bat Contact Pos - Z')
+        return self._pitch.get('Bat Contact Pos - Z')
     
     def dickball(self) -> Optional[int]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('DB')
+        return self._pitch.get('DB')
     
     def type_of_swing(self) -> Optional[str]:
         """
         Returns None if no pitch in event
         """
-        return self.pitch_dict().get('Type of Swing')
+        return self._pitch.get('Type of Swing')
 
     def contact_dict(self) -> dict:
         """
         Returns an empty dict if no contact in event
         """
-        return self.pitch_dict().get('Contact', {})
+        return self._contact
 
     def type_of_contact(self) -> Optional[str]:
         """
         Returns None if no contact in event
         """
-        return self.contact_dict().get('Type of Contact')
+        return self._contact.get('Type of Contact')
 
     def charge_power_up(self) -> Optional[int]:
         """
         Returns None if no contact in event
         """
-        return self.contact_dict().get('Charge Power Up')
+        return self._contact.get('Charge Power Up')
 
     def charge_power_down(self) -> Optional[int]:
         """
         Returns None if no contact in event
         """
-        return self.contact_dict().get('Charge Power Down')
+        return self._contact.get('Charge Power Down')
 
     def five_star_swing(self) -> Optional[int]:
         """
         Returns None if no contact in event
         """
-        return self.contact_dict().get('Star Swing Five-Star')
+        return self._contact.get('Star Swing Five-Star')
 
     def input_direction_push_or_pull(self) -> Optional[str]:
         """
         Returns None if no contact in event
         """
-        return self.contact_dict().get('Input Direction - Push/Pull')
+        return self._contact.get('Input Direction - Push/Pull')
 
     def stick_input_direction(self) -> Optional[str]:
         """
         Returns None if no contact in event
         """
-        return self.contact_dict().get('Input Direction - Stick')
+        return self._contact.get('Input Direction - Stick')
 
     def contact_frame(self) -> Optional[int]:
         """
         Returns None if no contact in event
         """
-        return self.safe_int(self.contact_dict().get('Frame of Swing Upon Contact'))
+        return self.safe_int(self._contact.get('Frame of Swing Upon Contact'))
 
     def ball_power(self) -> Optional[int]:
         """
         Returns None if no contact in event
         """
-        return self.safe_int(self.contact_dict().get('Ball Power'))
+        return self.safe_int(self._contact.get('Ball Power'))
 
     def vert_angle(self) -> Optional[int]:
         """
         Returns None if no contact in event.
         """
-        return self.safe_int(self.contact_dict().get('Vert Angle'))
+        return self.safe_int(self._contact.get('Vert Angle'))
 
     def horiz_angle(self) -> Optional[int]:
         """
         Returns None if no contact in event.
         """
-        return self.safe_int(self.contact_dict().get('Horiz Angle'))
+        return self.safe_int(self._contact.get('Horiz Angle'))
 
     def contact_absolute(self) -> Optional[float]:
         """
         Returns None if no contact in event.
         """
-        return self.contact_dict().get('Contact Absolute')
+        return self._contact.get('Contact Absolute')
 
     def contact_quality(self) -> Optional[float]:
         """
         Returns None if no contact in event.
         """
-        return self.contact_dict().get('Contact Quality')
+        return self._contact.get('Contact Quality')
 
     def rng(self) -> tuple[Optional[int], Optional[int], Optional[int]]:
         """
         Returns None if no contact in event.
         Returns a vector (rng1, rng2, rng3) of RNG components.
         """
-        rng1 = self.safe_int(self.contact_dict().get('RNG1'))
-        rng2 = self.safe_int(self.contact_dict().get('RNG2'))
-        rng3 = self.safe_int(self.contact_dict().get('RNG3'))
+        rng1 = self.safe_int(self._contact.get('RNG1'))
+        rng2 = self.safe_int(self._contact.get('RNG2'))
+        rng3 = self.safe_int(self._contact.get('RNG3'))
         return (rng1, rng2, rng3)
 
     def ball_velocity(self) -> tuple:
@@ -1725,9 +1814,9 @@ class EventObj():
         Returns None if no contact in event.
         Returns a vector (x, y, z) of ball velocity components.
         """
-        x = self.contact_dict().get('Ball Velocity - X')
-        y = self.contact_dict().get('Ball Velocity - Y')
-        z = self.contact_dict().get('Ball Velocity - Z')
+        x = self._contact.get('Ball Velocity - X')
+        y = self._contact.get('Ball Velocity - Y')
+        z = self._contact.get('Ball Velocity - Z')
         return (x, y, z)
 
     def ball_contact_position(self) -> tuple:
@@ -1735,8 +1824,8 @@ class EventObj():
         Returns None if no contact in event.
         Returns a vector (x, z) of ball contact position components.
         """
-        x = self.contact_dict().get('Ball Contact Pos - X')
-        z = self.contact_dict().get('Ball Contact Pos - Z')
+        x = self._contact.get('Ball Contact Pos - X')
+        z = self._contact.get('Ball Contact Pos - Z')
         return (x, z)
 
     def ball_landing_position(self) -> tuple:
@@ -1744,114 +1833,135 @@ class EventObj():
         Returns None if no contact in event.
         Returns a vector (x, y, z) of ball landing position components.
         """
-        x = self.contact_dict().get('Ball Landing Position - X')
-        y = self.contact_dict().get('Ball Landing Position - Y')
-        z = self.contact_dict().get('Ball Landing Position - Z')
+        x = self._contact.get('Ball Landing Position - X')
+        y = self._contact.get('Ball Landing Position - Y')
+        z = self._contact.get('Ball Landing Position - Z')
         return (x, y, z)
 
     def ball_max_height(self) -> Optional[float]:
         """
         Returns None if no contact in event.
         """
-        return self.contact_dict().get('Ball Max Height')
+        return self._contact.get('Ball Max Height')
 
     def ball_hang_time(self) -> Optional[int]:
         """
         Returns None if no contact in event.
         """
-        return self.safe_int(self.contact_dict().get('Ball Hang Time'))
+        return self.safe_int(self._contact.get('Ball Hang Time'))
 
     def contact_result_primary(self) -> Optional[str]:
         """
         Returns None if no contact in event.
         """
-        return self.contact_dict().get('Contact Result - Primary')
+        return self._contact.get('Contact Result - Primary')
 
     def contact_result_secondary(self) -> Optional[str]:
         """
         Returns None if no contact in event.
         """
-        return self.contact_dict().get('Contact Result - Secondary')
+        return self._contact.get('Contact Result - Secondary')
 
     def first_fielder_dict(self) -> dict:
         """
         Returns an empty dict if no first fielder in event
         """
-        return self.contact_dict().get('First Fielder', {})
+        return self._first_fielder
     
     def first_fielder_roster_loc(self) -> Optional[int]:
         """
         Returns None if no first fielder in event.
         """
-        return self.first_fielder_dict().get('Fielder Roster Location')
+        return self._first_fielder.get('Fielder Roster Location')
 
     def first_fielder_position(self) -> Optional[str]:
         """
         Returns None if no first fielder in event.
         """
-        return self.first_fielder_dict().get('Fielder Position')
+        return self._first_fielder.get('Fielder Position')
 
     def first_fielder_character(self) -> Optional[str]:
         """
         Returns None if no first fielder in event.
         """
-        return self.first_fielder_dict().get('Fielder Character')
+        return self._first_fielder.get('Fielder Character')
 
     def first_fielder_action(self) -> Optional[str]:
         """
         Returns None if no first fielder in event.
         """
-        return self.first_fielder_dict().get('Fielder Action')
+        return self._first_fielder.get('Fielder Action')
 
     def first_fielder_jump(self) -> Optional[str]:
         """
         Returns None if no first fielder in event.
         """
-        return self.first_fielder_dict().get('Fielder Jump')
+        return self._first_fielder.get('Fielder Jump')
 
     def fielder_swap(self) -> Optional[str]:
         """
         Returns None if no first fielder in event.
         """
-        return self.first_fielder_dict().get('Fielder Swap')
+        return self._first_fielder.get('Fielder Swap')
 
     def first_fielder_maunual_selected(self) -> Optional[str]:
         """
         Returns None if no first fielder in event.
         """
-        return self.first_fielder_dict().get('Fielder Manual Selected')
+        return self._first_fielder.get('Fielder Manual Selected')
 
     def first_fielder_location(self) -> tuple:
         """
         Returns None if no first fielder in event.
         Returns a vector (x, y, z) of fielder position components.
         """
-        x = self.first_fielder_dict().get('Fielder Position - X')
-        y = self.first_fielder_dict().get('Fielder Position - Y')
-        z = self.first_fielder_dict().get('Fielder Position - Z')
+        x = self._first_fielder.get('Fielder Position - X')
+        y = self._first_fielder.get('Fielder Position - Y')
+        z = self._first_fielder.get('Fielder Position - Z')
         return (x, y, z)
 
     def first_fielder_bobble(self) -> Optional[str]:
         """
         Returns None if no first fielder in event.
         """
-        return self.first_fielder_dict().get('Fielder Bobble')
+        return self._first_fielder.get('Fielder Bobble')
     
 
+# (team, roster) -> the key of that character in a HUD file, roster -1 included as team_roster_str accepts it
+_HUD_ROSTER_KEYS = {(t, r): f"{'Away' if t == 0 else 'Home'} Roster {r}" for t in (0, 1) for r in range(-1, 9)}
+# team -> key, indexed after the team number has been checked
+_HUD_PLAYER_KEYS = ('Away Player', 'Home Player')
+_HUD_SCORE_KEYS = ('Away Score', 'Home Score')
+_HUD_STARS_KEYS = ('Away Stars', 'Home Stars')
+
 class HudObj:
     def __init__(self, hud_json: dict):
         self.hud_json = hud_json
         self.event_number = self.hud_json['Event Num']
+        # HUD event numbers carry an 'a' (during the at bat) or 'b' (at bat result) suffix, e.g. "45b"
+        event_string = str(self.event_number)
+        self._event_is_ab_result = event_string[-1:] == 'b'
+        # parsed on first access, see event_integer
+        self._event_integer = None
+        # team -> roster spot of that team's captain (the first one if there are several), see captain_index
+        self._captain_index = [None, None]
+        for (t, r), key in _HUD_ROSTER_KEYS.items():
+            if r == -1 or self._captain_index[t] is not None:
+                continue
+            character = hud_json.get(key)
+            if character and character.get('Captain') == 1:
+                self._captain_index[t] = r
 
     def event_integer(self) -> int:
-        return int(str(self.event_number)[:-1])
+        if self._event_integer is None:
+            event_string = str(self.event_number)
+            self._event_integer = int(event_string[:-1] if event_string[-1:].isalpha() else event_string)
+        return self._event_integer
 
     def player(self, teamNum: int) -> str:
-        ErrorChecker.check_team_num(teamNum)
-        if teamNum == 0:
-            return self.hud_json['Away Player']
-        elif teamNum == 1:
-            return self.hud_json['Home Player']
+        if teamNum != 0 and teamNum != 1:
+            ErrorChecker.check_team_num(teamNum)
+        return self.hud_json[_HUD_PLAYER_KEYS[teamNum]]
     
     def inning(self) -> int:
         return self.hud_json['Inning']
@@ -1863,10 +1973,9 @@ class HudObj:
         return float(self.hud_json['Inning'] + 0.5*self.hud_json['Half Inning'])
     
     def score(self, teamNum: int) -> int:
-        ErrorChecker.check_team_num(teamNum)
-        team_string = "Away" if teamNum == 0 else "Home"
-        
-        return self.hud_json[f'{team_string} Score']
+        if teamNum != 0 and teamNum != 1:
+            ErrorChecker.check_team_num(teamNum)
+        return self.hud_json[_HUD_SCORE_KEYS[teamNum]]
     
     def balls(self) -> int:
         return self.hud_json['Balls']
@@ -1881,10 +1990,9 @@ class HudObj:
         return self.hud_json['Star Chance']
     
     def team_stars(self, teamNum: int) -> int:
-        ErrorChecker.check_team_num(teamNum)
-        team_string = "Away" if teamNum == 0 else "Home"
-        
-        return self.hud_json[f'{team_string} Stars']
+        if teamNum != 0 and teamNum != 1:
+            ErrorChecker.check_team_num(teamNum)
+        return self.hud_json[_HUD_STARS_KEYS[teamNum]]
     
     def pitcher_stamina(self) -> int:
         return self.hud_json['Pitcher Stamina']
@@ -1911,38 +2019,40 @@ class HudObj:
         return bool(self.hud_json.get('Runner 3B'))
     
     def runner_on_base(self, baseNum: int) -> bool:
-        ErrorChecker.check_base_num(baseNum)
+        if baseNum < -1 or baseNum > 3:
+            ErrorChecker.check_base_num(baseNum)
         if baseNum == 0:
             return bool(self.hud_json.get('Runner Batter'))
         return bool(self.hud_json.get(f'Runner {baseNum}B'))
     
     def runner(self, baseNum: int):
-        ErrorChecker.check_base_num(baseNum)
+        if baseNum < -1 or baseNum > 3:
+            ErrorChecker.check_base_num(baseNum)
         if baseNum == 0:
             return self.hud_json.get('Runner Batter', {})
         else:
             return self.hud_json.get(f'Runner {baseNum}B', {})
 
     def team_roster_str(self, teamNum: int, rosterNum: int):
-        ErrorChecker.check_team_num(teamNum)
-        ErrorChecker.check_roster_num(rosterNum)
-        team_string = "Away" if teamNum == 0 else "Home"
-        return f'{team_string} Roster {rosterNum}'
+        key = _HUD_ROSTER_KEYS.get((teamNum, rosterNum))
+        if key is None:
+            ErrorChecker.check_team_num(teamNum)
+            ErrorChecker.check_roster_num(rosterNum)
+            raise KeyError((teamNum, rosterNum))
+        return key
     
     def character_offensive_stats(self, teamNum: int, rosterNum: int):
-        ErrorChecker.check_team_num(teamNum)
-        ErrorChecker.check_roster_num(rosterNum)
         return self.hud_json[self.team_roster_str(teamNum, rosterNum)]['Offensive Stats']
     
     def character_defensive_stats(self, teamNum: int, rosterNum: int):
-        ErrorChecker.check_team_num(teamNum)
-        ErrorChecker.check_roster_num(rosterNum)
         return self.hud_json[self.team_roster_str(teamNum, rosterNum)]['Defensive Stats']
 
     def roster(self, teamNum: int, output_format: str = "name") -> dict:
+        if teamNum != 0 and teamNum != 1:
+            ErrorChecker.check_team_num(teamNum)
         roster_dict = {}
         for i in range(9):
-            player = self.hud_json[self.team_roster_str(teamNum, i)]
+            player = self.hud_json[_HUD_ROSTER_KEYS[(teamNum, i)]]
             roster_dict[i] = {}
             roster_dict[i]['captain'] = player['Captain']
             roster_dict[i]['char_id'] = lookup.get_character(player['CharID'], output_format=output_format)
@@ -1953,16 +2063,17 @@ class HudObj:
         return self.hud_json['Outs'] + self.hud_json['Num Outs During Play'] == 3
     
     def event_result(self) -> str:
-        if str(self.hud_json['Event Num'])[-1] == 'b':
+        if self._event_is_ab_result:
             return self.hud_json['Result of AB']
         
         return 'In Play'
     
     def captain_index(self, teamNum: int) -> int:
-        ErrorChecker.check_team_num(teamNum)
-        for i in range(9):
-            if self.hud_json[self.team_roster_str(teamNum,i)]['Captain'] == 1:
-                return int(i)
+        if teamNum != 0 and teamNum != 1:
+            ErrorChecker.check_team_num(teamNum)
+        captainIndex = self._captain_index[teamNum]
+        if captainIndex is not None:
+            return captainIndex
         raise Exception(f'No captain on teamNum {teamNum}')
     
     def batting_team(self):